@@ -8,19 +8,20 @@ This module provides advanced analytical capabilities including:
 - Geographic clustering and insights
 """
 
+import gzip
+import hashlib
 import json
 import re
+import statistics
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass
-import pandas as pd
 
 # For NLP-based classification
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.cluster import KMeans
     from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
     HAS_SKLEARN = True
@@ -28,6 +29,26 @@ except ImportError:
     HAS_SKLEARN = False
     print("Warning: scikit-learn not available. Using keyword-based classification.")
 
+# Faster JSON decoding/encoding when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json_bytes(raw: bytes):
+    """Decode JSON from bytes, using orjson when available."""
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def dump_json_bytes(data) -> bytes:
+    """Encode data as indented UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        # Salary stats are numpy scalars when sklearn/numpy is installed
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 @dataclass
 class JobPosition:
@@ -81,6 +102,11 @@ class JobPosition:
         }
 
 
+def position_text(position: JobPosition) -> str:
+    """Build the lowercase text blob shared by the graduate and discipline classifiers."""
+    return f"{position.title} {position.tags} {position.organization} {position.description}".lower()
+
+
 class GraduatePositionDetector:
     """Detect if a position is truly a graduate assistantship/fellowship."""
     
@@ -130,15 +156,21 @@ class GraduatePositionDetector:
             ]
         }
     
-    def is_graduate_position(self, position: 'JobPosition') -> Tuple[bool, str, float]:
+    def is_graduate_position(self, position: 'JobPosition',
+                             text_content: Optional[str] = None) -> Tuple[bool, str, float]:
         """
         Determine if position is a graduate assistantship/fellowship.
         
+        Args:
+            position: JobPosition object
+            text_content: Pre-built lowercase text from position_text(), if available
+            
         Returns:
             Tuple of (is_graduate, classification_type, confidence_score)
         """
         # Combine all text fields for analysis, including description
-        text_content = f"{position.title} {position.tags} {position.organization} {position.description}".lower()
+        if text_content is None:
+            text_content = position_text(position)
         
         # Calculate scores
         grad_score = 0
@@ -254,20 +286,24 @@ class DisciplineClassifier:
         
         if HAS_SKLEARN:
             self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+            self._discipline_texts = None
             self.is_trained = False
     
-    def classify_position(self, position: JobPosition) -> Tuple[str, str]:
+    def classify_position(self, position: JobPosition,
+                          text_content: Optional[str] = None) -> Tuple[str, str]:
         """
         Classify a position into primary and secondary disciplines.
         
         Args:
             position: JobPosition object
+            text_content: Pre-built lowercase text from position_text(), if available
             
         Returns:
             Tuple of (primary_discipline, secondary_discipline)
         """
         # Combine title, tags, organization, and description for comprehensive analysis
-        text_content = f"{position.title} {position.tags} {position.organization} {position.description}".lower()
+        if text_content is None:
+            text_content = position_text(position)
         
         # Always use ML classification when available, regardless of text length
         if HAS_SKLEARN:
@@ -298,18 +334,15 @@ class DisciplineClassifier:
     def _ml_classify(self, text: str) -> Tuple[str, str]:
         """Machine learning-based classification using TF-IDF and semantic similarity."""
         
-        # Create training corpus from discipline keywords
-        discipline_texts = []
-        discipline_labels = []
-        
-        for discipline, keywords in self.discipline_keywords.items():
-            # Create representative text for each discipline
-            discipline_text = ' '.join(keywords)
-            discipline_texts.append(discipline_text)
-            discipline_labels.append(discipline)
+        # Training corpus from discipline keywords: one representative text per
+        # discipline. The vectorizer is refit per position (max_features depends
+        # on the job text), but the joined texts only need building once.
+        if self._discipline_texts is None:
+            self._discipline_texts = [' '.join(keywords) for keywords in self.discipline_keywords.values()]
+        discipline_labels = list(self.discipline_keywords)
         
         # Add the job text
-        all_texts = discipline_texts + [text]
+        all_texts = self._discipline_texts + [text]
         
         # Vectorize using TF-IDF
         tfidf_matrix = self.vectorizer.fit_transform(all_texts)
@@ -333,6 +366,28 @@ class DisciplineClassifier:
         return primary_discipline, secondary_discipline
 
 
+# Location parsing patterns for CostOfLivingAdjuster.get_cost_index
+_PARENS_RE = re.compile(r'\(([^)]*)\)')
+_STREET_ADDRESS_RE = re.compile(r'\b\d+[^,]*,?\s*')
+_INSTITUTION_RE = re.compile(r'\b(university of|college of|state university)\b')
+_STATE_ABBREV_RE = re.compile(r'\b([a-z]{2})\b')
+_LOCATION_SPLIT_RE = re.compile(r'[,\s]+')
+
+# Salary parsing for CostOfLivingAdjuster._extract_salary_value
+_NON_NUMERIC_SALARY_PHRASES = (
+    'commensurate', 'negotiable', 'competitive', 'none', 'n/a',
+    'depends on', 'varies', 'tbd', 'to be determined'
+)
+# Match patterns like $25,000, $25000, 25,000, 25000, 25.5k, etc.
+_SALARY_PATTERNS = [
+    re.compile(r'\$?(\d{1,3}(?:,\d{3})+(?:\.\d+)?)', re.IGNORECASE),  # $25,000 or 25,000
+    re.compile(r'\$?(\d{4,6}(?:\.\d+)?)', re.IGNORECASE),             # $25000 or 25000
+    re.compile(r'(\d{1,3}(?:\.\d+)?)[kK]', re.IGNORECASE),            # 25k or 25.5k
+    re.compile(r'(\d{1,3}(?:,\d{3})*)\s*(?:per|/)?\s*(?:year|annual)', re.IGNORECASE),  # 25,000 per year
+    re.compile(r'(\d{1,3}(?:,\d{3})*)\s*(?:per|/)?\s*(?:month)', re.IGNORECASE),        # 2,500 per month
+]
+
+
 class CostOfLivingAdjuster:
     """Adjust salaries to Lincoln, NE cost of living baseline."""
     
@@ -395,6 +450,9 @@ class CostOfLivingAdjuster:
             'vt': 'vermont', 'va': 'virginia', 'wa': 'washington', 'wv': 'west virginia',
             'wi': 'wisconsin', 'wy': 'wyoming'
         }
+        
+        # Parsed indices by raw location string; postings often repeat locations
+        self._cost_index_cache = {}
     
     def get_cost_index(self, location: str) -> float:
         """
@@ -406,18 +464,26 @@ class CostOfLivingAdjuster:
         Returns:
             Cost of living index (Lincoln, NE = 1.0)
         """
+        index = self._cost_index_cache.get(location)
+        if index is None:
+            index = self._parse_cost_index(location)
+            self._cost_index_cache[location] = index
+        return index
+    
+    def _parse_cost_index(self, location: str) -> float:
+        """Parse a location string and look up its cost of living index."""
         if not location or location.lower() in ['n/a', 'not specified', 'various']:
             return 1.0
         
         location_lower = location.lower().strip()
         
         # Extract useful information from parentheticals first
-        paren_match = re.search(r'\(([^)]*)\)', location_lower)
+        paren_match = _PARENS_RE.search(location_lower)
         location_from_parens = paren_match.group(1) if paren_match else ""
         
         # Remove full addresses but preserve city/state info
-        location_clean = re.sub(r'\b\d+[^,]*,?\s*', '', location_lower)  # Remove street addresses
-        location_clean = re.sub(r'\b(university of|college of|state university)\b', '', location_clean)
+        location_clean = _STREET_ADDRESS_RE.sub('', location_lower)  # Remove street addresses
+        location_clean = _INSTITUTION_RE.sub('', location_clean)
         location_clean = location_clean.strip()
         
         # Priority 1: Check parenthetical content first (often contains city, state)
@@ -433,7 +499,7 @@ class CostOfLivingAdjuster:
         
         # Priority 3: Check for state abbreviations in parenthetical content
         if location_from_parens:
-            state_match = re.search(r'\b([a-z]{2})\b', location_from_parens)
+            state_match = _STATE_ABBREV_RE.search(location_from_parens)
             if state_match:
                 abbrev = state_match.group(1)
                 if abbrev in self.state_abbrevs:
@@ -442,7 +508,7 @@ class CostOfLivingAdjuster:
                         return self.cost_indices[state_name]
         
         # Priority 4: Check for state abbreviations in cleaned location
-        state_match = re.search(r'\b([a-z]{2})\b', location_clean)
+        state_match = _STATE_ABBREV_RE.search(location_clean)
         if state_match:
             abbrev = state_match.group(1)
             if abbrev in self.state_abbrevs:
@@ -454,8 +520,8 @@ class CostOfLivingAdjuster:
         # Check both parenthetical and cleaned content
         all_parts = []
         if location_from_parens:
-            all_parts.extend(re.split(r'[,\s]+', location_from_parens))
-        all_parts.extend(re.split(r'[,\s]+', location_clean))
+            all_parts.extend(_LOCATION_SPLIT_RE.split(location_from_parens))
+        all_parts.extend(_LOCATION_SPLIT_RE.split(location_clean))
         
         for part in all_parts:
             part = part.strip()
@@ -509,32 +575,19 @@ class CostOfLivingAdjuster:
         salary_lower = salary_str.lower()
         
         # Return 0 for explicitly non-numeric salaries
-        if any(phrase in salary_lower for phrase in [
-            'commensurate', 'negotiable', 'competitive', 'none', 'n/a', 
-            'depends on', 'varies', 'tbd', 'to be determined'
-        ]):
+        if any(phrase in salary_lower for phrase in _NON_NUMERIC_SALARY_PHRASES):
             return 0.0
         
         # Find all monetary amounts in the string
-        # Match patterns like $25,000, $25000, 25,000, 25000, 25.5k, etc.
-        money_patterns = [
-            r'\$?(\d{1,3}(?:,\d{3})+(?:\.\d+)?)',  # $25,000 or 25,000
-            r'\$?(\d{4,6}(?:\.\d+)?)',             # $25000 or 25000
-            r'(\d{1,3}(?:\.\d+)?)[kK]',            # 25k or 25.5k
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:per|/)?\s*(?:year|annual)',  # 25,000 per year
-            r'(\d{1,3}(?:,\d{3})*)\s*(?:per|/)?\s*(?:month)',        # 2,500 per month
-        ]
-        
         amounts = []
-        for pattern in money_patterns:
-            matches = re.findall(pattern, salary_str, re.IGNORECASE)
-            for match in matches:
+        for pattern in _SALARY_PATTERNS:
+            for match in pattern.findall(salary_str):
                 try:
                     # Clean and convert
                     clean_num = match.replace(',', '')
                     
                     # Handle 'k' suffix
-                    if 'k' in salary_lower and clean_num in salary_str.lower():
+                    if 'k' in salary_lower and clean_num in salary_lower:
                         value = float(clean_num) * 1000
                     else:
                         value = float(clean_num)
@@ -579,23 +632,47 @@ class HistoricalDataManager:
     def load_historical_data(self) -> List[Dict]:
         """Load existing historical data."""
         if self.historical_file.exists():
-            with open(self.historical_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Handle both old format (list) and new format (dict with positions key)
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and 'positions' in data:
-                    return data['positions']
-                else:
-                    return []
+            data = load_json_bytes(self.historical_file.read_bytes())
+            # Handle both old format (list) and new format (dict with positions key)
+            if isinstance(data, list):
+                return self._rekey_positions(data)
+            elif isinstance(data, dict) and 'positions' in data:
+                return self._rekey_positions(data['positions'])
+            else:
+                return []
         return []
     
+    def _rekey_positions(self, positions: List[Dict]) -> List[Dict]:
+        """
+        Recompute position IDs and collapse records that share one.
+        
+        Older histories were keyed by the per-process hash(), so the same
+        posting could be stored under several IDs. Each duplicate keeps the
+        latest record's fields with the earliest first_seen.
+        """
+        id_index = {}
+        rekeyed = []
+        for pos in positions:
+            pos_id = self.generate_position_id(pos)
+            pos['position_id'] = pos_id
+            i = id_index.get(pos_id)
+            if i is None:
+                id_index[pos_id] = len(rekeyed)
+                rekeyed.append(pos)
+                continue
+            first_seen = min(filter(None, (rekeyed[i].get('first_seen'), pos.get('first_seen'))), default=None)
+            if first_seen:
+                pos['first_seen'] = first_seen
+            rekeyed[i] = pos
+        return rekeyed
+    
     def generate_position_id(self, position: Dict) -> str:
         """Generate unique ID for position based on key fields."""
         # Use title + organization + location for uniqueness
         key_text = f"{position.get('title', '')}-{position.get('organization', '')}-{position.get('location', '')}"
-        # Simple hash for ID
-        return str(hash(key_text.lower().strip()))
+        # Short digest for ID; unlike hash() it is not salted per process,
+        # so the same posting maps to the same ID on every run
+        return hashlib.blake2b(key_text.lower().strip().encode(), digest_size=8).hexdigest()
     
     def merge_positions(self, new_positions: List[Dict]) -> Tuple[List[Dict], Dict]:
         """
@@ -608,7 +685,8 @@ class HistoricalDataManager:
             Tuple of (updated_historical_data, merge_stats)
         """
         historical_data = self.load_historical_data()
-        existing_ids = {pos.get('position_id') for pos in historical_data if pos.get('position_id')}
+        # IDs are unique after loading, so updates are a dict lookup
+        id_index = {pos['position_id']: i for i, pos in enumerate(historical_data)}
         
         new_count = 0
         updated_count = 0
@@ -620,23 +698,20 @@ class HistoricalDataManager:
             pos_id = self.generate_position_id(new_pos)
             new_pos['position_id'] = pos_id
             
-            if pos_id in existing_ids:
-                # Update existing position
-                for i, hist_pos in enumerate(historical_data):
-                    if hist_pos.get('position_id') == pos_id:
-                        # Update last_updated, preserve first_seen
-                        new_pos['first_seen'] = hist_pos.get('first_seen', current_date)
-                        new_pos['last_updated'] = current_date
-                        historical_data[i] = new_pos
-                        updated_count += 1
-                        break
+            i = id_index.get(pos_id)
+            if i is not None:
+                # Update existing position: refresh last_updated, preserve first_seen
+                new_pos['first_seen'] = historical_data[i].get('first_seen', current_date)
+                new_pos['last_updated'] = current_date
+                historical_data[i] = new_pos
+                updated_count += 1
             else:
                 # Add new position
                 new_pos['first_seen'] = current_date
                 new_pos['last_updated'] = current_date
+                id_index[pos_id] = len(historical_data)
                 historical_data.append(new_pos)
                 new_count += 1
-                existing_ids.add(pos_id)
         
         merge_stats = {
             'new_positions': new_count,
@@ -650,24 +725,51 @@ class HistoricalDataManager:
     def save_historical_data(self, data: List[Dict], backup: bool = True) -> None:
         """Save historical data with optional backup."""
         if backup and self.historical_file.exists():
-            # Create backup
-            backup_file = self.archive_dir / f"historical_positions_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(self.historical_file, 'r') as src, open(backup_file, 'w') as dst:
-                dst.write(src.read())
+            # Create compressed backup; level 1 keeps it fast and still shrinks JSON several-fold
+            backup_file = self.archive_dir / f"historical_positions_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz"
+            with gzip.open(backup_file, 'wb', compresslevel=1) as dst:
+                dst.write(self.historical_file.read_bytes())
         
-        # Save updated data
-        with open(self.historical_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save updated data, serialised in memory and written in one call
+        self.historical_file.write_bytes(dump_json_bytes(data))
+
+
+# Regional mapping (simplified) used by EnhancedAnalyzer._determine_region
+_REGION_STATES = {
+    'Northeast': ['maine', 'new hampshire', 'vermont', 'massachusetts', 'rhode island', 
+                  'connecticut', 'new york', 'new jersey', 'pennsylvania'],
+    'Southeast': ['delaware', 'maryland', 'virginia', 'west virginia', 'kentucky', 
+                  'tennessee', 'north carolina', 'south carolina', 'georgia', 'florida', 
+                  'alabama', 'mississippi', 'arkansas', 'louisiana'],
+    'Midwest': ['ohio', 'michigan', 'indiana', 'wisconsin', 'illinois', 'minnesota', 
+                'iowa', 'missouri', 'north dakota', 'south dakota', 'nebraska', 'kansas'],
+    'Southwest': ['texas', 'oklahoma', 'new mexico', 'arizona'],
+    'West': ['montana', 'wyoming', 'colorado', 'utah', 'idaho', 'washington', 'oregon', 
+             'california', 'nevada', 'alaska', 'hawaii'],
+    'Remote/Multiple': ['remote', 'multiple', 'various', 'national']
+}
 
 
 class EnhancedAnalyzer:
     """Main enhanced analysis coordinator."""
     
+    # JobPosition fields and the value used when a raw record lacks them
+    POSITION_FIELD_DEFAULTS = {
+        'title': '', 'organization': '', 'location': '', 'salary': '',
+        'starting_date': '', 'published_date': '', 'tags': '', 'description': '',
+        'discipline_primary': '', 'discipline_secondary': '',
+        'salary_lincoln_adjusted': 0.0, 'cost_of_living_index': 0.0,
+        'geographic_region': '', 'is_graduate_position': False, 'position_type': '',
+        'grad_confidence': 0.0, 'first_seen': '', 'last_updated': '',
+        'scraped_at': '', 'scrape_run_id': '', 'scraper_version': ''
+    }
+    
     def __init__(self):
         self.grad_detector = GraduatePositionDetector()
         self.discipline_classifier = DisciplineClassifier()
         self.cost_adjuster = CostOfLivingAdjuster()
         self.historical_manager = HistoricalDataManager()
+        self._region_cache = {}
     
     def analyze_positions(self, positions_data: List[Dict]) -> Dict:
         """
@@ -681,6 +783,12 @@ class EnhancedAnalyzer:
         """
         # Convert to enhanced position objects
         enhanced_positions = []
+        field_defaults = self.POSITION_FIELD_DEFAULTS.items()
+        
+        # One timestamp for the whole run, used to fill missing scrape metadata
+        analysis_time = datetime.now()
+        default_scraped_at = analysis_time.isoformat()
+        default_run_id = f"analysis_{analysis_time.strftime('%Y%m%d_%H%M%S')}"
         
         for pos_data in positions_data:
             # Handle missing description field for backward compatibility
@@ -688,47 +796,34 @@ class EnhancedAnalyzer:
                 pos_data['description'] = ''
             
             # Create a cleaned position dict with only JobPosition fields
-            cleaned_pos_data = {}
-            job_position_fields = {
-                'title', 'organization', 'location', 'salary', 'starting_date', 
-                'published_date', 'tags', 'description', 'discipline_primary', 
-                'discipline_secondary', 'salary_lincoln_adjusted', 'cost_of_living_index',
-                'geographic_region', 'is_graduate_position', 'position_type', 
-                'grad_confidence', 'first_seen', 'last_updated', 'scraped_at',
-                'scrape_run_id', 'scraper_version'
-            }
-            
-            for field in job_position_fields:
-                if field in pos_data:
-                    cleaned_pos_data[field] = pos_data[field]
-                elif field == 'description':
-                    cleaned_pos_data[field] = ''
-                elif field in ['salary_lincoln_adjusted', 'cost_of_living_index', 'grad_confidence']:
-                    cleaned_pos_data[field] = 0.0
-                elif field in ['is_graduate_position']:
-                    cleaned_pos_data[field] = False
-                else:
-                    cleaned_pos_data[field] = ''
+            cleaned_pos_data = {field: pos_data.get(field, default) for field, default in field_defaults}
             
             # Ensure scrape metadata is captured
             if not cleaned_pos_data.get('scraped_at'):
-                cleaned_pos_data['scraped_at'] = datetime.now().isoformat()
+                cleaned_pos_data['scraped_at'] = default_scraped_at
             if not cleaned_pos_data.get('scrape_run_id'):
-                cleaned_pos_data['scrape_run_id'] = f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                cleaned_pos_data['scrape_run_id'] = default_run_id
             if not cleaned_pos_data.get('scraper_version'):
                 cleaned_pos_data['scraper_version'] = "enhanced_analysis_v1.0"
             
             position = JobPosition(**cleaned_pos_data)
             
+            # Lowercase the combined text once for both classifiers
+            text_content = position_text(position)
+            
             # Detect if this is truly a graduate position
-            is_grad, position_type, confidence = self.grad_detector.is_graduate_position(position)
+            is_grad, position_type, confidence = self.grad_detector.is_graduate_position(
+                position, text_content
+            )
             position.is_graduate_position = is_grad
             position.position_type = position_type
             position.grad_confidence = confidence
             
             # Only classify discipline for confirmed graduate positions
             if is_grad:
-                primary, secondary = self.discipline_classifier.classify_position(position)
+                primary, secondary = self.discipline_classifier.classify_position(
+                    position, text_content
+                )
                 position.discipline_primary = primary
                 position.discipline_secondary = secondary
             else:
@@ -764,24 +859,17 @@ class EnhancedAnalyzer:
         if not location:
             return "Unknown"
         
+        region = self._region_cache.get(location)
+        if region is None:
+            region = self._match_region(location)
+            self._region_cache[location] = region
+        return region
+    
+    def _match_region(self, location: str) -> str:
+        """Match a non-empty location string against the regional mapping."""
         location_lower = location.lower()
         
-        # Regional mapping (simplified)
-        regions = {
-            'Northeast': ['maine', 'new hampshire', 'vermont', 'massachusetts', 'rhode island', 
-                         'connecticut', 'new york', 'new jersey', 'pennsylvania'],
-            'Southeast': ['delaware', 'maryland', 'virginia', 'west virginia', 'kentucky', 
-                         'tennessee', 'north carolina', 'south carolina', 'georgia', 'florida', 
-                         'alabama', 'mississippi', 'arkansas', 'louisiana'],
-            'Midwest': ['ohio', 'michigan', 'indiana', 'wisconsin', 'illinois', 'minnesota', 
-                       'iowa', 'missouri', 'north dakota', 'south dakota', 'nebraska', 'kansas'],
-            'Southwest': ['texas', 'oklahoma', 'new mexico', 'arizona'],
-            'West': ['montana', 'wyoming', 'colorado', 'utah', 'idaho', 'washington', 'oregon', 
-                    'california', 'nevada', 'alaska', 'hawaii'],
-            'Remote/Multiple': ['remote', 'multiple', 'various', 'national']
-        }
-        
-        for region, states in regions.items():
+        for region, states in _REGION_STATES.items():
             if any(state in location_lower for state in states):
                 return region
         
@@ -795,29 +883,33 @@ class EnhancedAnalyzer:
         """Generate comprehensive analytics from historical data."""
         total_positions = len(historical_data)
         
-        # Filter to only graduate positions for discipline analysis
-        grad_positions = [pos for pos in historical_data if pos.get('is_graduate_position', False)]
-        
-        # Discipline analysis (graduate positions only)
-        disciplines = Counter(pos.get('discipline_primary', 'Other') for pos in grad_positions)
-        
-        # Position type analysis
-        position_types = Counter(pos.get('position_type', 'Unknown') for pos in historical_data)
+        # Single pass over all positions; discipline and salary analysis
+        # use graduate positions only, the other breakdowns use everything
+        grad_count = 0
+        high_confidence_grad = 0
+        disciplines = Counter()
+        position_types = Counter()
+        regions = Counter()
+        salaries = []  # Lincoln-adjusted
         
-        # Graduate position confidence analysis
-        high_confidence_grad = len([pos for pos in historical_data if pos.get('grad_confidence', 0) > 0.7])
-        
-        # Geographic analysis (all positions)
-        regions = Counter(pos.get('geographic_region', 'Unknown') for pos in historical_data)
-        
-        # Salary analysis (Lincoln-adjusted, graduate positions only)
-        salaries = [pos.get('salary_lincoln_adjusted', 0) for pos in grad_positions if pos.get('salary_lincoln_adjusted', 0) > 0]
+        for pos in historical_data:
+            position_types[pos.get('position_type', 'Unknown')] += 1
+            regions[pos.get('geographic_region', 'Unknown')] += 1
+            if pos.get('grad_confidence', 0) > 0.7:
+                high_confidence_grad += 1
+            
+            if pos.get('is_graduate_position', False):
+                grad_count += 1
+                disciplines[pos.get('discipline_primary', 'Other')] += 1
+                salary = pos.get('salary_lincoln_adjusted', 0)
+                if salary > 0:
+                    salaries.append(salary)
         
         salary_stats = {}
         if salaries:
             salary_stats = {
                 'mean': np.mean(salaries) if HAS_SKLEARN else sum(salaries) / len(salaries),
-                'median': np.median(salaries) if HAS_SKLEARN else sorted(salaries)[len(salaries)//2],
+                'median': np.median(salaries) if HAS_SKLEARN else statistics.median(salaries),
                 'min': min(salaries),
                 'max': max(salaries),
                 'count': len(salaries)
@@ -828,13 +920,13 @@ class EnhancedAnalyzer:
         
         return {
             'total_positions': total_positions,
-            'graduate_positions': len(grad_positions),
-            'non_graduate_positions': total_positions - len(grad_positions),
+            'graduate_positions': grad_count,
+            'non_graduate_positions': total_positions - grad_count,
             'high_confidence_graduate': high_confidence_grad,
             'merge_stats': merge_stats,
-            'disciplines': dict(disciplines),
-            'position_types': dict(position_types),
-            'geographic_regions': dict(regions),
+            'disciplines': disciplines,
+            'position_types': position_types,
+            'geographic_regions': regions,
             'salary_analysis_lincoln_adjusted': salary_stats,
             'temporal_trends': temporal_data,
             'last_updated': datetime.now().isoformat()
@@ -842,8 +934,8 @@ class EnhancedAnalyzer:
     
     def _analyze_temporal_trends(self, historical_data: List[Dict]) -> Dict:
         """Analyze temporal trends in job postings."""
-        # Group by published month/year
-        monthly_counts = defaultdict(int)
+        # Collect published month/year keys, then count them in one go
+        year_months = []
         
         for pos in historical_data:
             pub_date = pos.get('published_date', '')
@@ -852,12 +944,19 @@ class EnhancedAnalyzer:
                     # Parse date and extract year-month
                     if '/' in pub_date:  # MM/DD/YYYY format
                         month, day, year = pub_date.split('/')
-                        year_month = f"{year}-{month.zfill(2)}"
-                        monthly_counts[year_month] += 1
+                        year_months.append(f"{year}-{month.zfill(2)}")
                 except:
                     continue
         
-        return dict(monthly_counts)
+        return Counter(year_months)
+
+
+def _source_hash(raw_input: bytes, history_file: Path) -> str:
+    """Digest of the analysis inputs: the verified positions and the stored history."""
+    digest = hashlib.blake2b(raw_input, digest_size=16)
+    if history_file.exists():
+        digest.update(hashlib.blake2b(history_file.read_bytes(), digest_size=16).digest())
+    return digest.hexdigest()
 
 
 def main():
@@ -868,17 +967,31 @@ def main():
         print("No verified graduate assistantships data found. Run the scraper first.")
         return
     
-    with open(data_file, 'r', encoding='utf-8') as f:
-        current_positions = json.load(f)
-    
-    # Run enhanced analysis
+    raw_input = data_file.read_bytes()
     analyzer = EnhancedAnalyzer()
+    history_file = analyzer.historical_manager.historical_file
+    source_hash = _source_hash(raw_input, history_file)
+    
+    # Skip the run when the previous analysis was built from identical input
+    # and the history it merges into has not been restored or edited since
+    output_file = Path("data/processed/enhanced_analysis.json")
+    if output_file.exists():
+        try:
+            previous = load_json_bytes(output_file.read_bytes())
+            if previous.get('source_hash') == source_hash:
+                print("Input unchanged since last analysis; skipping.")
+                return
+        except (json.JSONDecodeError, AttributeError):
+            pass
+    
+    current_positions = load_json_bytes(raw_input)
+    
+    # Run enhanced analysis; it rewrites the history, so key on the saved file
     results = analyzer.analyze_positions(current_positions)
+    results['source_hash'] = _source_hash(raw_input, history_file)
     
     # Save enhanced results
-    output_file = Path("data/processed/enhanced_analysis.json")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(dump_json_bytes(results))
     
     # Print summary
     print(f"Enhanced analysis complete!")
@@ -3,114 +3,153 @@ Enhanced dashboard data generation with detailed analytics for disciplines,
 trends, and salary analysis by discipline.
 """
 
+import hashlib
+import heapq
 import json
-import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from collections import Counter, defaultdict
 import re
+import statistics
 from typing import Dict, List, Optional
 
+# Faster JSON encoding/decoding when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def load_verified_graduate_data() -> List[Dict]:
+
+# Monetary amounts like $25,000, $25000 or 25k, matched in a single scan
+_MONEY_RE = re.compile(
+    r'\$?(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d{4,6}(?:\.\d+)?)'  # $25,000 / $25000
+    r'|(\d{1,3}(?:\.\d+)?)[kK]'                             # 25k
+)
+_DIGIT_RE = re.compile(r'\d')
+_SKIP_PHRASES = ('commensurate', 'negotiable', 'competitive', 'none', 'n/a')
+_GRAD_RE = re.compile(r'grad|phd|master')  # 'grad' also covers 'graduate'
+# MM/DD/YYYY or YYYY-MM-DD, the two shapes the scraper emits
+_DATE_RE = re.compile(r'(?:(\d{1,2})/(\d{1,2}| \d)/(\d{4})|(\d{4})-(\d{1,2})-(\d{1,2}| \d))')
+
+# Old discipline categories mapped to the 5 consolidated categories
+_DISCIPLINE_MAP = {
+    # Fisheries Management and Conservation
+    'Fisheries & Aquatic Science': 'Fisheries Management and Conservation',
+    'Fisheries Science': 'Fisheries Management and Conservation',
+    'Fisheries Management and Conservation': 'Fisheries Management and Conservation',
+    
+    # Wildlife Management and Conservation  
+    'Wildlife & Natural Resources': 'Wildlife Management and Conservation',
+    'Wildlife Ecology': 'Wildlife Management and Conservation', 
+    'Wildlife Management and Conservation': 'Wildlife Management and Conservation',
+    'Conservation Biology': 'Wildlife Management and Conservation',
+    
+    # Human Dimensions
+    'Human Dimensions': 'Human Dimensions',
+    
+    # Habitat and Environmental Science
+    'Environmental Science': 'Habitat and Environmental Science',
+    'Quantitative Ecology': 'Habitat and Environmental Science',
+    'Ecosystem Ecology': 'Habitat and Environmental Science',
+    'Ecotoxicology': 'Habitat and Environmental Science', 
+    'Fire Ecology': 'Habitat and Environmental Science',
+    'Climate Science': 'Habitat and Environmental Science',
+    
+    # Other
+    'Other': 'Other',
+    'Genetics/Genomics': 'Other',
+    'Non-Graduate': 'Other'  # This should be filtered out by graduate detection
+}
+
+VERIFIED_DATA_FILE = Path("data/processed/verified_graduate_assistantships.json")
+# Cache key of the last dashboard build; kept beside the input, not in the published site
+DASHBOARD_INPUT_HASH_FILE = VERIFIED_DATA_FILE.with_name(".dashboard_input_hash")
+
+
+def load_verified_graduate_data(raw: Optional[bytes] = None) -> List[Dict]:
     """Load verified graduate assistantship positions data.
     
     Uses ML-classified data from verified_graduate_assistantships.json
-    instead of keyword-filtered historical data for accuracy.
+    instead of keyword-filtered historical data for accuracy. Pass the
+    file's bytes as raw when they have already been read.
     """
-    verified_file = Path("data/processed/verified_graduate_assistantships.json")
-    if verified_file.exists():
-        with open(verified_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    if raw is None:
+        if not VERIFIED_DATA_FILE.exists():
+            return []
+        raw = VERIFIED_DATA_FILE.read_bytes()
+    # Both decoders accept UTF-8 bytes directly, skipping a text-mode decode
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
 
+def write_json(path: Path, data, indent: bool = True) -> None:
+    """Write data as UTF-8 JSON in a single write, using orjson when available.
+    
+    Pass indent=False for large machine-read files to skip pretty-printing.
+    """
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+    elif indent:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    else:
+        path.write_text(json.dumps(data, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
 def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse various date formats."""
+    """Parse various date formats.
+    
+    Cached because every position's published date is parsed by the discipline,
+    time-series and overview builders, and many postings share a date.
+    """
     if not date_str:
         return None
     
+    # One match picks the format; datetime() validates the ranges
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    
+    month, day, year, iso_year, iso_month, iso_day = match.groups()
     try:
-        # Handle MM/DD/YYYY format
-        if '/' in date_str:
-            return datetime.strptime(date_str, '%m/%d/%Y')
-        # Handle YYYY-MM-DD format
-        elif '-' in date_str:
-            return datetime.strptime(date_str, '%Y-%m-%d')
-    except:
-        pass
-    
-    return None
-
-
-def extract_salary_amount(salary_str: str) -> float:
-    """Extract numeric salary amount from salary string."""
-    if not salary_str or salary_str.lower() in ['none', 'commensurate / negotiable', 'negotiable']:
-        return 0
-    
-    # Remove common text and extract numbers
-    import re
-    # Look for patterns like $20,000 or $20k or $1,500 per month
-    patterns = [
-        r'\$([0-9,]+(?:\.[0-9]{2})?)',  # $20,000 or $20,000.00
-        r'([0-9,]+(?:\.[0-9]{2})?).*per.*year',  # 20,000 per year
-        r'([0-9,]+(?:\.[0-9]{2})?).*per.*month',  # 1,500 per month
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, salary_str.replace(',', ''))
-        if match:
-            try:
-                amount = float(match.group(1).replace(',', ''))
-                # Convert monthly to annual if needed
-                if 'per month' in salary_str.lower() or 'month' in salary_str.lower():
-                    amount *= 12
-                return amount
-            except:
-                continue
-    
-    return 0
+        if year:
+            return datetime(int(year), int(month), int(day))
+        return datetime(int(iso_year), int(iso_month), int(iso_day))
+    except ValueError:
+        return None
 
 
 def extract_salary_value(salary_str: str) -> Optional[float]:
     """Extract numeric salary value and convert monthly to annual."""
-    if not salary_str:
+    # Most non-numeric salaries ("Commensurate", "N/A", ...) have no digits at all
+    if not salary_str or not _DIGIT_RE.search(salary_str):
         return None
         
     salary_lower = salary_str.lower()
     
     # Skip non-numeric salaries
-    if any(phrase in salary_lower for phrase in [
-        'commensurate', 'negotiable', 'competitive', 'none', 'n/a'
-    ]):
+    if any(phrase in salary_lower for phrase in _SKIP_PHRASES):
         return None
     
     # Find monetary amounts
-    money_patterns = [
-        r'\$?(\d{1,3}(?:,\d{3})+(?:\.\d+)?)',  # $25,000
-        r'\$?(\d{4,6}(?:\.\d+)?)',             # $25000
-        r'(\d{1,3}(?:\.\d+)?)[kK]',            # 25k
-    ]
-    
     amounts = []
-    for pattern in money_patterns:
-        matches = re.findall(pattern, salary_str, re.IGNORECASE)
-        for match in matches:
-            try:
-                clean_num = match.replace(',', '')
-                if 'k' in salary_lower:
-                    value = float(clean_num) * 1000
-                else:
-                    value = float(clean_num)
-                
-                # Convert monthly to annual if explicitly mentioned
-                if 'month' in salary_lower and value > 100:
-                    value *= 12
-                
-                if 1000 <= value <= 200000:
-                    amounts.append(value)
-            except:
-                continue
+    for full_amount, k_amount in _MONEY_RE.findall(salary_str):
+        try:
+            clean_num = (full_amount or k_amount).replace(',', '')
+            if 'k' in salary_lower:
+                value = float(clean_num) * 1000
+            else:
+                value = float(clean_num)
+            
+            # Convert monthly to annual if explicitly mentioned
+            if 'month' in salary_lower and value > 100:
+                value *= 12
+            
+            if 1000 <= value <= 200000:
+                amounts.append(value)
+        except:
+            continue
     
     return max(amounts) if amounts else None
 
@@ -122,62 +161,18 @@ def convert_monthly_to_annual(salary_value: float, salary_original: str = "") ->
     
     salary_lower = salary_original.lower() if salary_original else ""
     
-    # If explicitly mentioned as monthly in original, convert regardless of current value
-    if 'month' in salary_lower and salary_value > 0:
-        # If the value is already high, it might have been converted, check if it makes sense
-        if salary_value < 5000:  # Definitely monthly amount 
-            return salary_value * 12
-        elif salary_value < 8000:  # Possibly monthly, be conservative
-            return salary_value * 12
-        # If value is already high (>8000), assume it's already been converted or is annual
-        return salary_value
-    
-    # Auto-detect likely monthly salaries based on value ranges for graduate assistantships
-    # Graduate assistantships typically range from $1,000-$3,500 per month
-    # which would be $12,000-$42,000 annually
-    if 1000 <= salary_value <= 4000:  # Very likely monthly amount
+    # Graduate assistantships typically pay $1,000-$3,500 per month, so anything
+    # under $8,000 is treated as monthly: always when the original says "month",
+    # otherwise only from $800 up. Higher values are assumed to be annual already.
+    if 0 < salary_value < 8000 and ('month' in salary_lower or salary_value >= 800):
         return salary_value * 12
     
-    # Very low amounts (under $8,000) are likely monthly if they're reasonable monthly amounts
-    elif salary_value < 8000 and salary_value >= 800:  # $800-$8000 range, likely monthly
-        return salary_value * 12
-    
-    # Return original value if it seems like an annual amount
     return salary_value
 
 
 def consolidate_discipline(discipline: str) -> str:
     """Map old discipline categories to the 5 consolidated categories."""
-    discipline_mapping = {
-        # Fisheries Management and Conservation
-        'Fisheries & Aquatic Science': 'Fisheries Management and Conservation',
-        'Fisheries Science': 'Fisheries Management and Conservation',
-        'Fisheries Management and Conservation': 'Fisheries Management and Conservation',
-        
-        # Wildlife Management and Conservation  
-        'Wildlife & Natural Resources': 'Wildlife Management and Conservation',
-        'Wildlife Ecology': 'Wildlife Management and Conservation', 
-        'Wildlife Management and Conservation': 'Wildlife Management and Conservation',
-        'Conservation Biology': 'Wildlife Management and Conservation',
-        
-        # Human Dimensions
-        'Human Dimensions': 'Human Dimensions',
-        
-        # Habitat and Environmental Science
-        'Environmental Science': 'Habitat and Environmental Science',
-        'Quantitative Ecology': 'Habitat and Environmental Science',
-        'Ecosystem Ecology': 'Habitat and Environmental Science',
-        'Ecotoxicology': 'Habitat and Environmental Science', 
-        'Fire Ecology': 'Habitat and Environmental Science',
-        'Climate Science': 'Habitat and Environmental Science',
-        
-        # Other
-        'Other': 'Other',
-        'Genetics/Genomics': 'Other',
-        'Non-Graduate': 'Other'  # This should be filtered out by graduate detection
-    }
-    
-    return discipline_mapping.get(discipline, 'Other')
+    return _DISCIPLINE_MAP.get(discipline, 'Other')
 
 
 def generate_discipline_analytics(positions: List[Dict]) -> Dict:
@@ -185,18 +180,19 @@ def generate_discipline_analytics(positions: List[Dict]) -> Dict:
     discipline_data = defaultdict(lambda: {
         'count': 0,
         'grad_salaries': [],  # Only graduate assistantship salaries
-        'monthly_trends': defaultdict(int),
-        'positions': []
+        'grad_positions': 0,
+        'monthly_trends': Counter()
     })
     
     for pos in positions:
         # Verified data uses 'discipline' field instead of 'discipline_primary'
         original_discipline = pos.get('discipline', 'Other')
         # Consolidate to one of the 5 categories
-        discipline = consolidate_discipline(original_discipline)
+        data = discipline_data[_DISCIPLINE_MAP.get(original_discipline, 'Other')]
         
-        discipline_data[discipline]['count'] += 1
-        discipline_data[discipline]['positions'].append(pos)
+        data['count'] += 1
+        if _GRAD_RE.search(pos.get('tags', '').lower()):
+            data['grad_positions'] += 1
         
         # All positions are pre-verified graduate assistantships
         # Parse salary from the original salary string since verified data doesn't have lincoln_adjusted
@@ -206,13 +202,13 @@ def generate_discipline_analytics(positions: List[Dict]) -> Dict:
         if salary_adjusted and salary_adjusted > 0:
             # Convert monthly to annual if needed
             final_salary = convert_monthly_to_annual(salary_adjusted, salary_original)
-            discipline_data[discipline]['grad_salaries'].append(final_salary)
+            data['grad_salaries'].append(final_salary)
         
         # Add to monthly trends
         pub_date = parse_date(pos.get('published_date', ''))
         if pub_date:
-            month_key = pub_date.strftime('%Y-%m')
-            discipline_data[discipline]['monthly_trends'][month_key] += 1
+            month_key = f"{pub_date.year}-{pub_date.month:02d}"
+            data['monthly_trends'][month_key] += 1
     
     # Calculate salary statistics for each discipline (graduate assistantships only)
     result = {}
@@ -223,7 +219,7 @@ def generate_discipline_analytics(positions: List[Dict]) -> Dict:
             salary_stats = {
                 'count': len(grad_salaries),
                 'mean': sum(grad_salaries) / len(grad_salaries),
-                'median': sorted(grad_salaries)[len(grad_salaries)//2],
+                'median': statistics.median(grad_salaries),
                 'min': min(grad_salaries),
                 'max': max(grad_salaries),
                 'range': max(grad_salaries) - min(grad_salaries)
@@ -232,10 +228,8 @@ def generate_discipline_analytics(positions: List[Dict]) -> Dict:
         result[discipline] = {
             'total_positions': data['count'],
             'salary_stats': salary_stats,
-            'monthly_trends': dict(data['monthly_trends']),
-            'grad_positions': len([p for p in data['positions'] 
-                                 if any(tag in p.get('tags', '').lower() 
-                                       for tag in ['graduate', 'grad', 'phd', 'master'])])
+            'monthly_trends': data['monthly_trends'],
+            'grad_positions': data['grad_positions']
         }
     
     return result
@@ -244,46 +238,51 @@ def generate_discipline_analytics(positions: List[Dict]) -> Dict:
 def generate_time_series_data(positions: List[Dict], timeframes: List[str]) -> Dict:
     """Generate time series data for different timeframes using graduate assistantships only."""
     now = datetime.now()
-    timeframe_data = {}
     
+    # Calculate cutoff date for each timeframe
+    cutoffs = {}
     for timeframe in timeframes:
-        # Calculate cutoff date
         if timeframe == '1_month':
-            cutoff = now - timedelta(days=30)
+            cutoffs[timeframe] = now - timedelta(days=30)
         elif timeframe == '6_months':
-            cutoff = now - timedelta(days=180)
+            cutoffs[timeframe] = now - timedelta(days=180)
         elif timeframe == '1_year':
-            cutoff = now - timedelta(days=365)
+            cutoffs[timeframe] = now - timedelta(days=365)
         else:
-            cutoff = datetime(2020, 1, 1)  # All time
-        
-        # Filter positions by timeframe AND graduate status
-        filtered_positions = []
-        for pos in positions:
-            pub_date = parse_date(pos.get('published_date', ''))
-            # All positions are pre-verified graduate assistantships
-            if pub_date and pub_date >= cutoff:
-                filtered_positions.append(pos)
-        
-        # Generate monthly counts overall and by discipline
-        monthly_counts = defaultdict(int)
-        discipline_monthly = defaultdict(lambda: defaultdict(int))
+            cutoffs[timeframe] = datetime(2020, 1, 1)  # All time
+    
+    # Generate monthly counts overall and by discipline for every timeframe in a
+    # single pass; positions without a valid date never count
+    monthly_counts = {timeframe: defaultdict(int) for timeframe in cutoffs}
+    discipline_monthly = {timeframe: Counter() for timeframe in cutoffs}  # (discipline, month) -> count
+    position_counts = dict.fromkeys(cutoffs, 0)
+    
+    for pos in positions:
+        pub_date = parse_date(pos.get('published_date', ''))
+        if not pub_date:
+            continue
+        month_key = f"{pub_date.year}-{pub_date.month:02d}"
+        original_discipline = pos.get('discipline', 'Other')
+        # Consolidate to one of the 5 categories
+        discipline = _DISCIPLINE_MAP.get(original_discipline, 'Other')
         
-        for pos in filtered_positions:
-            pub_date = parse_date(pos.get('published_date', ''))
-            if pub_date:
-                month_key = pub_date.strftime('%Y-%m')
-                monthly_counts[month_key] += 1
-                
-                original_discipline = pos.get('discipline', 'Other')
-                # Consolidate to one of the 5 categories
-                discipline = consolidate_discipline(original_discipline)
-                discipline_monthly[discipline][month_key] += 1
+        # All positions are pre-verified graduate assistantships
+        for timeframe, cutoff in cutoffs.items():
+            if pub_date >= cutoff:
+                monthly_counts[timeframe][month_key] += 1
+                discipline_monthly[timeframe][(discipline, month_key)] += 1
+                position_counts[timeframe] += 1
+    
+    timeframe_data = {}
+    for timeframe in cutoffs:
+        by_discipline = defaultdict(dict)
+        for (discipline, month_key), count in discipline_monthly[timeframe].items():
+            by_discipline[discipline][month_key] = count
         
         timeframe_data[timeframe] = {
-            'total_monthly': dict(monthly_counts),
-            'discipline_monthly': {k: dict(v) for k, v in discipline_monthly.items()},
-            'position_count': len(filtered_positions)
+            'total_monthly': dict(monthly_counts[timeframe]),
+            'discipline_monthly': dict(by_discipline),
+            'position_count': position_counts[timeframe]
         }
     
     return timeframe_data
@@ -310,7 +309,7 @@ def generate_export_data(positions: List[Dict]) -> List[Dict]:
             'title': pos.get('title', ''),
             'organization': pos.get('organization', ''),
             'location': pos.get('location', ''),
-            'discipline_primary': consolidate_discipline(original_discipline_primary),
+            'discipline_primary': _DISCIPLINE_MAP.get(original_discipline_primary, 'Other'),
             'discipline_secondary': consolidate_discipline(original_discipline_secondary) if original_discipline_secondary else '',
             'salary_original': salary_original,
             'salary_lincoln_adjusted': salary_adjusted,
@@ -332,8 +331,24 @@ def generate_export_data(positions: List[Dict]) -> List[Dict]:
 
 def main():
     """Generate enhanced dashboard data."""
+    dashboard_dir = Path("dashboard")
+    
+    # Skip regeneration when the input is unchanged. The date is part of the key
+    # because the 30-day/6-month windows move even when the data does not.
+    cache_key = None
+    raw = None
+    hash_file = DASHBOARD_INPUT_HASH_FILE
+    if VERIFIED_DATA_FILE.exists():
+        raw = VERIFIED_DATA_FILE.read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cache_key = f"{digest} {datetime.now().date().isoformat()}"
+        if (hash_file.exists() and hash_file.read_text(encoding='utf-8') == cache_key
+                and (dashboard_dir / "enhanced_data.json").exists()):
+            print("Input unchanged since last run; dashboard data is up to date.")
+            return
+    
     # Load verified graduate assistantship data
-    positions = load_verified_graduate_data()
+    positions = load_verified_graduate_data(raw) if raw is not None else []
     
     if not positions:
         print("No verified graduate assistantship data found. Run the main scraper first.")
@@ -352,77 +367,88 @@ def main():
     export_data = generate_export_data(positions)
     
     # Get top disciplines for dashboard
-    top_disciplines = sorted(discipline_analytics.items(), 
-                           key=lambda x: x[1]['total_positions'], 
-                           reverse=True)[:10]
+    top_disciplines = heapq.nlargest(10, discipline_analytics.items(),
+                                     key=lambda x: x[1]['total_positions'])
     
-    # Calculate 6-month positions (all are pre-verified graduate assistantships)
-    six_months_ago = datetime.now() - timedelta(days=180)
-    six_month_grad_positions = [p for p in positions 
-                               if parse_date(p.get('published_date', ''))
-                               and parse_date(p.get('published_date', '')) >= six_months_ago]
+    # Single pass over positions for the 6-month window, the 30-day count and
+    # the latest scrape (all are pre-verified graduate assistantships)
+    now = datetime.now()
+    six_months_ago = now - timedelta(days=180)
+    thirty_days_ago = now - timedelta(days=30)
+    six_month_grad_positions = []
+    recent_30_days = 0
+    latest_scraped = None
+    run_id_counts = Counter()
+    salaried_count = 0
+    salary_total = 0
+    region_counts = Counter()
+    for p in positions:
+        scraped_at = p.get('scraped_at')
+        if scraped_at and (latest_scraped is None or scraped_at > latest_scraped['scraped_at']):
+            latest_scraped = p
+        run_id_counts[p.get('scrape_run_id')] += 1
+        
+        pub_date = parse_date(p.get('published_date', ''))
+        if not pub_date:
+            continue
+        if pub_date >= thirty_days_ago:
+            recent_30_days += 1
+        if pub_date < six_months_ago:
+            continue
+        
+        # Salary and geographic aggregates for the 6-month window
+        six_month_grad_positions.append(p)
+        salary_original = p.get('salary', '')
+        salary_value = extract_salary_value(salary_original)
+        if salary_value:
+            salaried_count += 1
+            salary_total += convert_monthly_to_annual(salary_value, salary_original)
+        region = p.get('geographic_region')
+        if region:
+            region_counts[region] += 1
     
     # Get latest scrape information
     latest_scrape_info = {}
-    if positions:
-        # Find the most recent scrape
-        scraped_positions = [p for p in positions if p.get('scraped_at')]
-        if scraped_positions:
-            latest_scraped = max(scraped_positions, key=lambda p: p.get('scraped_at', ''))
-            latest_scrape_info = {
-                'last_scraped': latest_scraped.get('scraped_at', ''),
-                'scrape_run_id': latest_scraped.get('scrape_run_id', ''),
-                'scraper_version': latest_scraped.get('scraper_version', ''),
-                'positions_in_latest_scrape': len([p for p in positions 
-                                                 if p.get('scrape_run_id') == latest_scraped.get('scrape_run_id', '')])
-            }
+    if latest_scraped:
+        latest_scrape_info = {
+            'last_scraped': latest_scraped.get('scraped_at', ''),
+            'scrape_run_id': latest_scraped.get('scrape_run_id', ''),
+            'scraper_version': latest_scraped.get('scraper_version', ''),
+            'positions_in_latest_scrape': run_id_counts[latest_scraped.get('scrape_run_id', '')]
+        }
 
     # Create comprehensive dashboard data
     dashboard_data = {
-        'last_updated': datetime.now().isoformat(),
+        'last_updated': now.isoformat(),
         'total_positions': len(six_month_grad_positions),  # 6-month graduate positions
         'overview': {
             'total_disciplines': len(discipline_analytics),
-            'positions_with_salaries': len([p for p in six_month_grad_positions 
-                                           if extract_salary_value(p.get('salary', ''))]),
+            'positions_with_salaries': salaried_count,
             'graduate_positions': len(six_month_grad_positions),
-            'recent_positions_30_days': len([p for p in positions 
-                                           if parse_date(p.get('published_date', '')) 
-                                           and parse_date(p.get('published_date', '')) >= (datetime.now() - timedelta(days=30))])
+            'recent_positions_30_days': recent_30_days
         },
         'scrape_info': latest_scrape_info,
         'discipline_analytics': discipline_analytics,
         'time_series': time_series,
         'top_disciplines': {name: data for name, data in top_disciplines},
-        'geographic_analytics': {
-            region: len([p for p in six_month_grad_positions if p.get('geographic_region') == region])
-            for region in set(p.get('geographic_region', 'Other') for p in six_month_grad_positions 
-                             if p.get('geographic_region'))
-        },
+        'geographic_analytics': region_counts,
         'salary_overview': {
-            'positions_with_salary': len([p for p in six_month_grad_positions 
-                                        if extract_salary_value(p.get('salary', ''))]),
-            'average_lincoln_adjusted': sum(convert_monthly_to_annual(extract_salary_value(p.get('salary', '')) or 0, p.get('salary', '')) 
-                                          for p in six_month_grad_positions 
-                                          if extract_salary_value(p.get('salary', ''))) / 
-                                       len([p for p in six_month_grad_positions 
-                                           if extract_salary_value(p.get('salary', ''))]) if 
-                                       len([p for p in six_month_grad_positions 
-                                           if extract_salary_value(p.get('salary', ''))]) > 0 else 0
+            'positions_with_salary': salaried_count,
+            'average_lincoln_adjusted': salary_total / salaried_count if salaried_count > 0 else 0
         }
     }
     
     # Save dashboard data
-    dashboard_dir = Path("dashboard")
     dashboard_dir.mkdir(exist_ok=True)
     
-    with open(dashboard_dir / "enhanced_data.json", 'w', encoding='utf-8') as f:
-        json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
-    
-    # Save export data as JSON (will be converted to CSV by dashboard)
-    with open(dashboard_dir / "export_data.json", 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    write_json(dashboard_dir / "enhanced_data.json", dashboard_data)
     
+    # Save export data as compact JSON (will be converted to CSV by dashboard)
+    write_json(dashboard_dir / "export_data.json", export_data, indent=False)
+
+    if cache_key:
+        hash_file.write_text(cache_key, encoding='utf-8')
+
     print("Enhanced dashboard data generated successfully!")
     print(f"- Total positions: {len(positions)}")
     print(f"- Disciplines analyzed: {len(discipline_analytics)}")
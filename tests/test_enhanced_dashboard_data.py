@@ -0,0 +1,106 @@
+"""
+Tests for dashboard data generation.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.analysis import enhanced_dashboard_data
+from src.analysis.enhanced_dashboard_data import main, parse_date
+
+
+def _position(title):
+    """Minimal verified graduate position."""
+    return {
+        'title': title,
+        'organization': 'State University',
+        'location': 'Lincoln, NE',
+        'salary': '$25,000',
+        'published_date': '06/20/2025',
+        'tags': 'Graduate Opportunities',
+        'discipline': 'Wildlife Management and Conservation',
+        'scraped_at': '2025-06-21T08:00:00',
+        'scrape_run_id': 'run_1',
+    }
+
+
+class TestParseDate:
+    """Test parsing of posting dates."""
+
+    @pytest.mark.parametrize("date_str, expected", [
+        ("06/20/2025", datetime(2025, 6, 20)),   # MM/DD/YYYY
+        ("6/2/2025", datetime(2025, 6, 2)),      # single-digit month and day
+        ("6/ 2/2025", datetime(2025, 6, 2)),     # space-padded day
+        ("02/29/2024", datetime(2024, 2, 29)),   # leap day
+        ("2025-06-20", datetime(2025, 6, 20)),   # YYYY-MM-DD
+        ("2025-6-2", datetime(2025, 6, 2)),
+        ("2025-06- 2", datetime(2025, 6, 2)),
+    ])
+    def test_supported_formats(self, date_str, expected):
+        """Test each supported format parses to midnight on that date."""
+        assert parse_date(date_str) == expected
+
+    @pytest.mark.parametrize("date_str", [
+        "",
+        None,
+        "not a date",
+        "June 20, 2025",
+        "13/01/2025",           # month out of range
+        "02/30/2025",           # day out of range
+        "02/29/2025",           # not a leap year
+        "2025-13-01",
+        "2025/06/20",           # ISO order with slashes
+        "06-20-2025",
+        "06/20/25",             # two-digit year
+        "20250620",
+        "2025-06-20T10:00:00",  # trailing time
+    ])
+    def test_invalid_input(self, date_str):
+        """Test unsupported or out-of-range dates return None."""
+        assert parse_date(date_str) is None
+
+
+class TestDashboardInputCache:
+    """Test skipping regeneration when the verified data is unchanged."""
+
+    @pytest.fixture(autouse=True)
+    def workdir(self, tmp_path, monkeypatch):
+        """Run main() against a throwaway data/ and dashboard/ tree."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data" / "processed").mkdir(parents=True)
+        return tmp_path
+
+    def _write_input(self, positions):
+        enhanced_dashboard_data.VERIFIED_DATA_FILE.write_text(json.dumps(positions), encoding='utf-8')
+
+    def _run(self):
+        """Run main() and report whether the dashboard was regenerated."""
+        with patch.object(enhanced_dashboard_data, 'generate_discipline_analytics',
+                          wraps=enhanced_dashboard_data.generate_discipline_analytics) as analytics:
+            main()
+        return analytics.called
+
+    def test_unchanged_input_skips_then_changed_input_regenerates(self, workdir):
+        """Test a second run is skipped and a changed input is picked up."""
+        self._write_input([_position('Wildlife Researcher')])
+
+        assert self._run() is True
+        assert self._run() is False
+
+        self._write_input([_position('Wildlife Researcher'), _position('Fisheries Researcher')])
+
+        assert self._run() is True
+        output = json.loads((workdir / "dashboard" / "enhanced_data.json").read_text(encoding='utf-8'))
+        assert output['discipline_analytics']['Wildlife Management and Conservation']['total_positions'] == 2
+
+    def test_cache_key_not_published(self, workdir):
+        """Test the cache key is kept beside the input rather than in dashboard/."""
+        self._write_input([_position('Wildlife Researcher')])
+
+        main()
+
+        assert enhanced_dashboard_data.DASHBOARD_INPUT_HASH_FILE.exists()
+        assert not list((workdir / "dashboard").glob(".*"))
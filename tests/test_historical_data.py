@@ -0,0 +1,120 @@
+"""
+Tests for historical position storage and merging.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.analysis.enhanced_analysis import EnhancedAnalyzer, HistoricalDataManager, main
+
+
+class TestHistoricalDataManager:
+    """Test position IDs and merging into historical data."""
+
+    @pytest.fixture(autouse=True)
+    def manager(self, tmp_path):
+        """Manager writing to a throwaway data directory."""
+        self.manager = HistoricalDataManager(tmp_path)
+        return self.manager
+
+    def test_position_id_is_pinned_digest(self):
+        """Test the ID is a fixed blake2b digest, not a per-process hash()."""
+        position = {'title': 'Test Position', 'organization': 'Test University', 'location': 'Test, TX'}
+
+        assert self.manager.generate_position_id(position) == '2790bea772923084'
+
+    def test_merge_updates_in_place(self):
+        """Test a repeated posting replaces its record without reordering or duplicating."""
+        positions = [
+            {'title': f'Position {i}', 'organization': 'State University', 'location': 'City, State'}
+            for i in range(3)
+        ]
+        historical_data, _ = self.manager.merge_positions([dict(pos) for pos in positions])
+        first_seen = historical_data[1]['first_seen']
+        self.manager.save_historical_data(historical_data, backup=False)
+
+        repeat = dict(positions[1], salary='$30,000')
+        historical_data, stats = self.manager.merge_positions([repeat])
+
+        assert [pos['title'] for pos in historical_data] == ['Position 0', 'Position 1', 'Position 2']
+        assert stats['new_positions'] == 0
+        assert stats['updated_positions'] == 1
+        assert historical_data[1]['salary'] == '$30,000'
+        assert historical_data[1]['first_seen'] == first_seen
+
+    def test_legacy_ids_are_rekeyed_on_load(self):
+        """Test history keyed by old hash() IDs is re-keyed and deduplicated."""
+        legacy = [
+            {'position_id': '-1907221980673612278', 'title': 'Wildlife Researcher',
+             'organization': 'State University', 'location': 'City, State',
+             'salary': '$25,000', 'first_seen': '2025-07-01T00:00:00', 'last_updated': '2025-07-01T00:00:00'},
+            {'position_id': '4417304416331459521', 'title': 'Wildlife Researcher',
+             'organization': 'State University', 'location': 'City, State',
+             'salary': '$26,000', 'first_seen': '2025-07-08T00:00:00', 'last_updated': '2025-07-08T00:00:00'},
+        ]
+        self.manager.save_historical_data(legacy, backup=False)
+
+        historical_data, stats = self.manager.merge_positions([
+            {'title': 'Wildlife Researcher', 'organization': 'State University',
+             'location': 'City, State', 'salary': '$27,000'}
+        ])
+
+        assert len(historical_data) == 1
+        assert stats['new_positions'] == 0
+        assert stats['updated_positions'] == 1
+        assert historical_data[0]['position_id'] == self.manager.generate_position_id(legacy[0])
+        assert historical_data[0]['salary'] == '$27,000'
+        assert historical_data[0]['first_seen'] == '2025-07-01T00:00:00'
+
+
+class TestAnalysisInputCache:
+    """Test skipping main() when neither the input nor the history changed."""
+
+    @pytest.fixture(autouse=True)
+    def workdir(self, tmp_path, monkeypatch):
+        """Run main() against a throwaway data/ tree."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data" / "processed").mkdir(parents=True)
+        return tmp_path
+
+    def _write_input(self, workdir, titles):
+        positions = [
+            {'title': title, 'organization': 'Test University', 'location': 'Lincoln, Nebraska',
+             'salary': '$25,000 per year', 'published_date': '06/20/2025',
+             'tags': 'Graduate Opportunities'}
+            for title in titles
+        ]
+        data_file = workdir / "data" / "processed" / "verified_graduate_assistantships.json"
+        data_file.write_text(json.dumps(positions), encoding='utf-8')
+
+    def _run(self):
+        """Run main() and report whether the positions were analysed."""
+        with patch.object(EnhancedAnalyzer, 'analyze_positions', autospec=True,
+                          side_effect=EnhancedAnalyzer.analyze_positions) as analyze:
+            main()
+        return analyze.called
+
+    def test_unchanged_input_skips_then_changed_input_reruns(self, workdir):
+        """Test a second run is skipped and a changed input is picked up."""
+        self._write_input(workdir, ['PhD Research - Wildlife Ecology'])
+
+        assert self._run() is True
+        assert self._run() is False
+
+        self._write_input(workdir, ['PhD Research - Wildlife Ecology', 'MS Assistantship - Fisheries'])
+
+        assert self._run() is True
+        results = json.loads((workdir / "data" / "processed" / "enhanced_analysis.json").read_text(encoding='utf-8'))
+        assert results['total_positions'] == 2
+
+    def test_changed_history_reruns(self, workdir):
+        """Test restoring or editing the history invalidates the cached analysis."""
+        self._write_input(workdir, ['PhD Research - Wildlife Ecology'])
+        assert self._run() is True
+
+        (workdir / "data" / "historical_positions.json").write_text('[]', encoding='utf-8')
+
+        assert self._run() is True
+        assert self._run() is False
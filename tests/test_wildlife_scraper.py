@@ -4,12 +4,14 @@ Unit tests for the wildlife job scraper.
 
 import json
 import tempfile
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pandas as pd
 import pytest
 from pydantic import ValidationError
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 
 from wildlife_job_scraper import (
@@ -219,30 +221,174 @@ class TestWildlifeJobScraper:
             assert len(result) == 1
             assert result[0].title == "Test Job"
             
+    @staticmethod
+    def _mock_detail_page(elements):
+        """Mock a job page whose find_element returns elements keyed by locator value."""
+        driver = Mock()
+        driver.execute_script.return_value = "Seasonal field position."
+        
+        def find_element(by, value):
+            if value in elements:
+                return elements[value]
+            raise NoSuchElementException(value)
+        
+        driver.find_element.side_effect = find_element
+        return driver
+        
+    def test_contact_info_ignores_contact_nav_link(self, scraper):
+        """A "Contact Us" link with no e-mail address is not contact info."""
+        nav_link = Mock(text="Contact Us")
+        nav_link.get_attribute.return_value = "https://jobs.rwfm.tamu.edu/contact/"
+        scraper.driver = self._mock_detail_page({
+            "//body//*[not(self::script or self::style)]"
+            "[contains(text(), 'contact') or contains(text(), 'Contact')]": nav_link,
+        })
+        
+        with patch.object(scraper, '_human_pause'):
+            job = scraper.extract_detailed_job_info(
+                JobListing(title="Test Job", url="https://example.com/job"))
+        
+        assert job.contact_info == ""
+        
+    def test_contact_info_from_mailto_link(self, scraper):
+        """A mailto: link supplies the address even when its text has none."""
+        mail_link = Mock(text="Email the PI")
+        mail_link.get_attribute.return_value = "mailto:pi@example.edu?subject=Assistantship"
+        scraper.driver = self._mock_detail_page({"a[href^='mailto:']": mail_link})
+        
+        with patch.object(scraper, '_human_pause'):
+            job = scraper.extract_detailed_job_info(
+                JobListing(title="Test Job", url="https://example.com/job"))
+        
+        assert job.contact_info == "pi@example.edu"
+        
+    def test_set_page_size_skips_when_already_selected(self, scraper):
+        """Re-selecting the current page size must not wait for a reload."""
+        scraper.driver = Mock()
+        with patch.object(scraper, '_wait_for_element'), \
+             patch.object(scraper, '_wait_for_results_refresh') as mock_refresh, \
+             patch('wildlife_job_scraper.Select') as mock_select_cls:
+            mock_select = mock_select_cls.return_value
+            mock_select.first_selected_option.text = f"Show {scraper.config.page_size}"
+            
+            scraper.set_page_size()
+            
+            mock_select.select_by_visible_text.assert_not_called()
+            mock_refresh.assert_not_called()
+            
+    def test_set_page_size_waits_for_reload(self, scraper):
+        """Changing the page size waits for the old results to be replaced."""
+        scraper.driver = Mock()
+        old_result = Mock()
+        with patch.object(scraper, '_wait_for_element'), \
+             patch.object(scraper, '_first_result', return_value=old_result), \
+             patch.object(scraper, '_wait_for_results_refresh') as mock_refresh, \
+             patch('wildlife_job_scraper.Select') as mock_select_cls:
+            mock_select = mock_select_cls.return_value
+            mock_select.first_selected_option.text = "Show 10"
+            
+            scraper.set_page_size()
+            
+            mock_select.select_by_visible_text.assert_called_once_with(f"Show {scraper.config.page_size}")
+            mock_refresh.assert_called_once_with(old_result)
+            
+    def test_set_date_filter_waits_for_reload(self, scraper):
+        """Choosing a date filter waits for the filtered results to replace the old ones."""
+        scraper.driver = Mock()
+        old_result = Mock()
+        filter_option = Mock()
+        with patch.object(scraper, '_wait_for_element', side_effect=[Mock(), filter_option]), \
+             patch.object(scraper, '_scroll_to_element'), \
+             patch.object(scraper, '_human_pause'), \
+             patch.object(scraper, '_first_result', return_value=old_result), \
+             patch.object(scraper, '_wait_for_results_refresh') as mock_refresh:
+            mock_refresh.side_effect = lambda result: filter_option.click.assert_called_once()
+            
+            scraper.set_date_filter()
+            
+            mock_refresh.assert_called_once_with(old_result)
+            
+    def test_results_refresh_uses_short_timeout_then_presence(self, scraper):
+        """A missing reload gives up after reload_timeout and checks for results."""
+        scraper.driver = Mock()
+        with patch('wildlife_job_scraper.WebDriverWait') as mock_wait_cls, \
+             patch.object(scraper, '_wait_for_element') as mock_presence:
+            mock_wait_cls.return_value.until.side_effect = TimeoutException()
+            
+            assert scraper._wait_for_results_refresh(Mock()) is False
+            
+            mock_wait_cls.assert_called_once_with(scraper.driver, scraper.config.reload_timeout)
+            mock_presence.assert_called_once_with((By.CSS_SELECTOR, "a.list-group-item"))
+            
+    def test_results_refresh_without_previous_results(self, scraper):
+        """With nothing to go stale, still wait for the results list."""
+        scraper.driver = Mock()
+        with patch('wildlife_job_scraper.WebDriverWait') as mock_wait_cls, \
+             patch.object(scraper, '_wait_for_element') as mock_presence:
+            assert scraper._wait_for_results_refresh(None) is True
+            
+            mock_wait_cls.assert_not_called()
+            mock_presence.assert_called_once_with((By.CSS_SELECTOR, "a.list-group-item"))
+            
+    def test_navigate_to_page_waits_full_timeout(self, scraper):
+        """Paging allows the full timeout for the old results to go stale."""
+        scraper.driver = Mock()
+        with patch.object(scraper, '_first_result', return_value=Mock()), \
+             patch.object(scraper, '_wait_for_results_refresh', return_value=True) as mock_refresh, \
+             patch.object(scraper, '_human_pause'):
+            assert scraper.navigate_to_page(2) is True
+            
+            assert mock_refresh.call_args.args[1] == scraper.config.timeout
+            
+    def test_navigate_to_page_reports_failed_load(self, scraper):
+        """A page that never reloads is reported instead of raising."""
+        scraper.driver = Mock()
+        with patch.object(scraper, '_first_result', return_value=Mock()), \
+             patch('wildlife_job_scraper.WebDriverWait') as mock_wait_cls, \
+             patch.object(scraper, '_wait_for_element'), \
+             patch.object(scraper, '_human_pause'):
+            mock_wait_cls.return_value.until.side_effect = TimeoutException()
+            
+            assert scraper.navigate_to_page(2) is False
+            
     def test_get_pagination_pages(self, scraper):
         """Test getting pagination page numbers."""
         scraper.driver = Mock()
         
-        # Mock pagination links
-        mock_link1 = Mock()
-        mock_link1.get_attribute.return_value = "pageNumCtrl.value=2; submitListingForm(true);"
-        mock_link2 = Mock()
-        mock_link2.get_attribute.return_value = "pageNumCtrl.value=3; submitListingForm(true);"
+        # onclick handlers as returned by the single execute_script call
+        scraper.driver.execute_script.return_value = [
+            "pageNumCtrl.value=2; submitListingForm(true);",
+            "pageNumCtrl.value=5; submitListingForm(true);",
+            None,
+            "pageNumCtrl.value=next; submitListingForm(true);",
+        ]
+        
+        result = scraper.get_pagination_pages()
         
-        scraper.driver.find_elements.return_value = [mock_link1, mock_link2]
+        # Every page up to the highest link, including ones not linked directly
+        assert result == [1, 2, 3, 4, 5]
+        scraper.driver.execute_script.assert_called_once()
+        scraper.driver.find_elements.assert_not_called()
+        
+    def test_get_pagination_pages_from_result_count(self, scraper):
+        """Without pagination links, the page count comes from the result total."""
+        scraper.driver = Mock()
+        scraper.driver.execute_script.return_value = []
+        scraper.driver.find_element.return_value = Mock(text="(1 - 50 of 233)")
         
         result = scraper.get_pagination_pages()
         
-        assert result == [2, 3]
+        pages = -(-233 // scraper.config.page_size)
+        assert result == list(range(1, pages + 1))
         
     def test_get_pagination_pages_exception(self, scraper):
         """Test pagination with exception."""
         scraper.driver = Mock()
-        scraper.driver.find_elements.side_effect = Exception("No pagination found")
+        scraper.driver.execute_script.side_effect = Exception("No pagination found")
         
         result = scraper.get_pagination_pages()
         
-        assert result == []
+        assert result == [1]
         
     def test_save_jobs_json(self, scraper):
         """Test saving jobs to JSON file."""
@@ -290,20 +436,124 @@ class TestWildlifeJobScraper:
         # Mock scraper methods
         with patch.object(scraper, 'set_page_size'), \
              patch.object(scraper, 'enter_search_keywords'), \
+             patch.object(scraper, 'set_date_filter'), \
              patch.object(scraper, 'extract_jobs_from_page') as mock_extract, \
              patch.object(scraper, 'get_pagination_pages') as mock_pagination, \
-             patch.object(scraper, 'navigate_to_page'):
+             patch.object(scraper, 'navigate_to_page'), \
+             patch.object(scraper, 'extract_detailed_job_info',
+                          side_effect=lambda job: job) as mock_details:
             
-            # Setup return values
-            test_jobs = [JobListing(title="Test Job")]
-            mock_extract.return_value = test_jobs
+            # Setup return values: page 2 repeats a listing from page 1, and
+            # listings without a URL are kept even when their titles match
+            page_1 = [
+                JobListing(title="Test Job"),
+                JobListing(title="Bat Technician", url="https://example.com/jobs/1"),
+            ]
+            page_2 = [
+                JobListing(title="Test Job"),
+                JobListing(title="Bat Technician", url="https://example.com/jobs/1"),
+                JobListing(title="Fisheries Technician", url="https://example.com/jobs/2"),
+            ]
+            mock_extract.side_effect = [page_1, page_2]
             mock_pagination.return_value = [1, 2]  # Two pages
             
             result = scraper.scrape_all_jobs()
             
-            # Should have jobs from both pages
-            assert len(result) == 2  # One job per page
+            # Both URL-less jobs plus one job per distinct URL
+            assert len(result) == 4
+            assert [job.url for job in result] == [
+                "", "https://example.com/jobs/1", "", "https://example.com/jobs/2"
+            ]
+            assert mock_details.call_count == 4  # The duplicate page is not revisited
             mock_driver.quit.assert_called_once()
+            
+    @patch('wildlife_job_scraper.WildlifeJobScraper.setup_driver')
+    def test_scrape_all_jobs_skips_page_that_fails_to_load(self, mock_setup_driver, scraper):
+        """A page that fails to load is skipped and the other pages are kept."""
+        mock_setup_driver.return_value = Mock()
+        
+        with patch.object(scraper, 'set_page_size'), \
+             patch.object(scraper, 'enter_search_keywords'), \
+             patch.object(scraper, 'set_date_filter'), \
+             patch.object(scraper, 'extract_jobs_from_page') as mock_extract, \
+             patch.object(scraper, 'get_pagination_pages', return_value=[1, 2, 3]), \
+             patch.object(scraper, 'navigate_to_page', side_effect=[False, True]), \
+             patch.object(scraper, 'extract_detailed_job_info', side_effect=lambda job: job):
+            mock_extract.side_effect = [
+                [JobListing(title="Page 1 Job", url="https://example.com/jobs/1")],
+                [JobListing(title="Page 3 Job", url="https://example.com/jobs/3")],
+            ]
+            
+            result = scraper.scrape_all_jobs()
+            
+            assert [job.title for job in result] == ["Page 1 Job", "Page 3 Job"]
+            assert mock_extract.call_count == 2
+            
+    def _write_previous_run(self, scraper, jobs):
+        """Write a previous run's all_positions_detailed.json."""
+        scraper.save_jobs_json(jobs, "all_positions_detailed.json")
+        
+    def test_cached_details_respect_max_age(self, scraper):
+        """Last week's detail pages are reused; older or empty ones are not."""
+        now = datetime.now(timezone.utc)
+        self._write_previous_run(scraper, [
+            JobListing(title="Fresh", url="https://example.com/fresh",
+                       description="Fresh description", requirements="MS degree",
+                       scraped_at=(now - timedelta(days=7)).isoformat()),
+            JobListing(title="Stale", url="https://example.com/stale",
+                       description="Old description",
+                       scraped_at=(now - timedelta(days=10)).isoformat()),
+            JobListing(title="Empty", url="https://example.com/empty", description=""),
+        ])
+        
+        cached = scraper._load_cached_details()
+        
+        assert set(cached) == {"https://example.com/fresh"}
+        assert cached["https://example.com/fresh"]["requirements"] == "MS degree"
+        
+    def test_cached_details_disabled(self, scraper):
+        """reuse_details=False forces every detail page to be fetched."""
+        self._write_previous_run(scraper, [
+            JobListing(title="Fresh", url="https://example.com/fresh", description="Fresh description")
+        ])
+        scraper.config.reuse_details = False
+        
+        assert scraper._load_cached_details() == {}
+        
+    @patch('wildlife_job_scraper.WildlifeJobScraper.setup_driver')
+    def test_scrape_all_jobs_reuses_recent_details(self, mock_setup_driver, scraper):
+        """Only expired detail pages are fetched again."""
+        now = datetime.now(timezone.utc)
+        fresh_time = (now - timedelta(days=7)).isoformat()
+        self._write_previous_run(scraper, [
+            JobListing(title="Fresh", url="https://example.com/fresh",
+                       description="Cached description", scraped_at=fresh_time),
+            JobListing(title="Stale", url="https://example.com/stale",
+                       description="Old description",
+                       scraped_at=(now - timedelta(days=10)).isoformat()),
+        ])
+        mock_setup_driver.return_value = Mock()
+        
+        with patch.object(scraper, 'set_page_size'), \
+             patch.object(scraper, 'enter_search_keywords'), \
+             patch.object(scraper, 'set_date_filter'), \
+             patch.object(scraper, 'extract_jobs_from_page') as mock_extract, \
+             patch.object(scraper, 'get_pagination_pages', return_value=[1]), \
+             patch.object(scraper, 'extract_detailed_job_info',
+                          side_effect=lambda job: job) as mock_details:
+            
+            mock_extract.return_value = [
+                JobListing(title="Fresh", url="https://example.com/fresh"),
+                JobListing(title="Stale", url="https://example.com/stale"),
+            ]
+            
+            result = scraper.scrape_all_jobs()
+            
+        fetched = [call.args[0].url for call in mock_details.call_args_list]
+        assert fetched == ["https://example.com/stale"]
+        fresh = next(job for job in result if job.title == "Fresh")
+        assert fresh.description == "Cached description"
+        assert fresh.scraped_at == fresh_time
 
 
 class TestEdgeCases:
@@ -5,14 +5,16 @@ A comprehensive scraper for graduate assistantship opportunities from
 the Texas A&M Wildlife and Fisheries job board.
 """
 
+import argparse
 import json
 import logging
 import os
 import random
+import re
 import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote
@@ -22,6 +24,7 @@ from dotenv import load_dotenv
 from fake_useragent import UserAgent
 from pydantic import BaseModel, Field, field_validator
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -30,10 +33,308 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Faster JSON serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Load environment variables
 load_dotenv()
 
+# Wildlife & Natural Resources discipline indicators
+_WILDLIFE_KEYWORDS = (
+    # Wildlife management and ecology
+    "wildlife", "wild animals", "animal ecology", "wildlife management",
+    "wildlife conservation", "game species", "hunting", "wildlife habitat",
+    "deer", "elk", "bear", "waterfowl", "bird", "avian", "ornithology",
+    "mammal", "ungulate", "predator", "carnivore", "herbivore",
+    "migration", "behavior", "animal behavior", "population dynamics",
+    "wildlife disease", "wildlife health", "capture", "telemetry",
+
+    # Habitat and ecosystem
+    "habitat", "ecosystem", "biodiversity", "conservation biology",
+    "landscape ecology", "habitat restoration", "wetland", "grassland",
+    "forest ecology", "rangeland", "prairie", "savanna"
+)
+
+# Fisheries & Aquatic Science indicators
+_FISHERIES_KEYWORDS = (
+    # Fish and aquatic life
+    "fish", "fisheries", "aquatic", "marine", "freshwater", "stream",
+    "river", "lake", "pond", "reservoir", "estuary", "coastal",
+    "salmon", "trout", "bass", "catfish", "walleye", "pike",
+    "aquaculture", "fish farming", "hatchery", "fish stocking",
+
+    # Aquatic ecology
+    "aquatic ecology", "stream ecology", "limnology", "hydrology",
+    "water quality", "aquatic habitat", "fish habitat", "spawning",
+    "fish population", "fish community", "ichthyology",
+    "aquatic invertebrates", "plankton", "algae", "aquatic plants"
+)
+
+# Natural Resource Management indicators
+_NATURAL_RESOURCES_KEYWORDS = (
+    # General natural resources
+    "natural resources", "resource management", "environmental management",
+    "land management", "public lands", "national forest", "state park",
+    "BLM", "bureau of land management", "forest service", "park service",
+
+    # Forestry and land use
+    "forestry", "forest management", "timber", "silviculture",
+    "fire ecology", "prescribed fire", "wildfire", "fire management",
+    "recreation", "outdoor recreation", "hunting", "fishing",
+    "grazing", "livestock", "ranching", "agriculture",
+
+    # Policy and human dimensions
+    "environmental policy", "natural resource policy", "environmental law",
+    "human dimensions", "stakeholder", "community engagement",
+    "environmental education", "interpretation", "outreach"
+)
+
+# Environmental Science (broader) indicators
+_ENVIRONMENTAL_KEYWORDS = (
+    # Environmental science
+    "environmental science", "environmental studies", "ecology",
+    "ecosystem services", "sustainability", "climate change",
+    "environmental chemistry", "environmental toxicology",
+    "environmental monitoring", "environmental assessment",
+
+    # Conservation and restoration
+    "conservation", "restoration", "endangered species", "threatened species",
+    "species recovery", "habitat restoration", "ecosystem restoration",
+    "invasive species", "native species", "biodiversity conservation",
+
+    # Pollution and contamination
+    "pollution", "contamination", "environmental remediation",
+    "water pollution", "air quality", "soil contamination",
+    "environmental health", "environmental impact"
+)
+
+# Discipline name -> keyword tuple used by WildlifeJobScraper.classify_discipline
+DISCIPLINE_KEYWORDS: Dict[str, tuple] = {
+    "Wildlife & Natural Resources": _WILDLIFE_KEYWORDS,
+    "Fisheries & Aquatic Science": _FISHERIES_KEYWORDS,
+    "Natural Resource Management": _NATURAL_RESOURCES_KEYWORDS,
+    "Environmental Science": _ENVIRONMENTAL_KEYWORDS
+}
+
+# Flattened (keyword, discipline, weight) triples so scoring is a single pass.
+# Longer, more specific keywords weigh more: 1 per word, capped at 3.
+_DISCIPLINE_TERMS = tuple(
+    (keyword, discipline, min(len(keyword.split()), 3))
+    for discipline, keywords in DISCIPLINE_KEYWORDS.items()
+    for keyword in keywords
+)
+
+
+# Graduate position indicators (positive signals) - ENHANCED
+_GRADUATE_INDICATORS = (
+    "graduate assistantship", "graduate assistant", "graduate student",
+    "master's student", "ms student", "phd student", "doctoral student",
+    "masters", "master's", "phd", "ph.d.", "doctorate", "doctoral",
+    "assistantship", "fellowship", "graduate", "grad student",
+    "thesis", "dissertation", "research assistant", "teaching assistant", 
+    "graduate research", "graduate teaching", "stipend", "tuition waiver",
+    "advisor", "adviser", "mentorship", "research project",
+    "academic year", "semester", "graduate program", "grad program"
+)
+
+# Non-graduate indicators (negative signals) - WILDLIFE-SPECIFIC ENHANCED
+_NON_GRADUATE_INDICATORS = (
+    # General professional roles
+    "professional position", "full-time employee", "staff position",
+    "technician", "tech", "coordinator", "manager", "director", 
+    "volunteer", "intern", "internship", "apprentice",
+    
+    # Wildlife/Natural Resource specific roles
+    "biologist", "hydrologist", "scientist", "botanist", "ecologist",
+    "conservationist", "park ranger", "crew leader", "crew member",
+    "habitat specialist", "regional coordinator", "liaison",
+    "educator", "specialist", "officer", "program officer", "programme officer",
+    "project manager", "production manager", "seasonal", 
+    "human resource officer", "hr officer",
+    
+    # Academic non-assistantship roles  
+    "continuing education", "certification", "workshop", "training program",
+    "degree program", "bachelor", "undergraduate", "post-doc", "postdoc",
+    "visiting scholar", "faculty", "professor", "lecturer"
+)
+
+# Research project indicators
+_RESEARCH_INDICATORS = (
+    "research", "study", "investigation", "analysis", "field work",
+    "data collection", "sampling", "monitoring", "experiment",
+    "publication", "conference", "methodology", "hypothesis"
+)
+
+# Key strong indicators that override the weighted scores
+_KEY_GRADUATE_TERMS = ("masters", "master's", "phd", "ph.d.", "assistantship", "fellowship")
+_KEY_PROFESSIONAL_TERMS = (
+    "biologist", "hydrologist", "scientist", "botanist", "technician",
+    "park ranger", "specialist", "coordinator", "manager", "officer"
+)
+
+
+def _classification_text(job: "JobListing") -> str:
+    """Lowercased text that the graduate and discipline classifiers scan."""
+    return f"{job.title} {job.description} {job.requirements} {job.project_details} {job.tags}".lower()
+
+
+# Fields filled in from a job's detail page
+_DETAIL_FIELDS = ("description", "requirements", "project_details", "contact_info", "application_deadline")
+
+# Job ID inside a listing's onclick handler
+_JOB_ID_RE = re.compile(r"view-job/\?id=(\d+)")
+
+# Total result count in the results summary, e.g. "(1 - 10 of 233)"
+_RESULTS_TOTAL_RE = re.compile(r'of\s+(\d+)')
+
+# Resource URLs the browser never needs to fetch for text scraping
+_BLOCKED_RESOURCE_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg"
+]
+
+# Detail-page lookups used by WildlifeJobScraper.extract_detailed_job_info,
+# built once at import rather than on every job page
+_DESCRIPTION_SELECTORS = (
+    "div.job-description",
+    "div.position-description",
+    "div[class*='description']",
+    "div.content",
+    "div.job-details",
+    ".card-body",
+    "main .container"
+)
+# Keeps the first selector whose text is substantial (> 100 chars), else the
+# last one found, else the page body. Unrendered elements read as '' (like .text).
+_DESCRIPTION_SCRIPT = """
+var selectors = arguments[0], text = '';
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el) {
+        text = el.getClientRects().length ? el.innerText.trim() : '';
+        if (text.length > 100) { break; }
+    }
+}
+return text || document.body.innerText.trim();
+"""
+_REQUIREMENT_XPATHS = tuple(
+    f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{keyword}')]"
+    for keyword in (
+        "requirements", "qualifications", "prerequisites",
+        "education", "experience", "skills", "must have"
+    )
+)
+# For each XPath, take the parent of the first match; keep the first text over
+# 50 chars, else the last one found. Unrendered parents read as '' (like .text).
+_REQUIREMENTS_SCRIPT = """
+var xpaths = arguments[0], text = '';
+for (var i = 0; i < xpaths.length; i++) {
+    var node = document.evaluate(
+        xpaths[i], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    var parent = node && node.parentElement;
+    if (parent) {
+        text = parent.getClientRects().length ? parent.innerText.trim() : '';
+        if (text.length > 50) { break; }
+    }
+}
+return text;
+"""
+_PROJECT_KEYWORDS = (
+    "research", "project", "thesis", "dissertation",
+    "study", "investigation", "analysis", "field work"
+)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+# Most specific first; the contains() predicates are XPath, not CSS. Inline
+# <script>/<style> blocks are skipped: their @media/@import text would match
+# first in document order, and .text reads them as ''
+_CONTACT_LOCATORS = (
+    (By.XPATH, "//body//*[not(self::script or self::style)][contains(text(), '@')]"),  # Email addresses
+    (By.CSS_SELECTOR, "a[href^='mailto:']"),
+    (By.XPATH, "//body//*[not(self::script or self::style)]"
+               "[contains(text(), 'contact') or contains(text(), 'Contact')]"),
+    (By.CSS_SELECTOR, ".contact-info")
+)
+_DEADLINE_PATTERNS = tuple(
+    (keyword, re.compile(
+        rf"{keyword}[:\s]*([^.]*(?:\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{2,4}}|[A-Za-z]+\s+\d{{1,2}},?\s*\d{{4}})[^.]*)",
+        re.IGNORECASE
+    ))
+    for keyword in ("deadline", "due", "apply by", "closing date")
+)
+
+# Big 10 universities (current conference members as of 2024), used by
+# WildlifeJobScraper.classify_university
+_BIG10_UNIVERSITIES = {
+    # Original Big 10
+    "university of illinois": "University of Illinois",
+    "university of chicago": "University of Chicago", 
+    "university of michigan": "University of Michigan",
+    "michigan state university": "Michigan State University",
+    "university of minnesota": "University of Minnesota",
+    "northwestern university": "Northwestern University", 
+    "ohio state university": "Ohio State University",
+    "purdue university": "Purdue University",
+    "university of wisconsin": "University of Wisconsin",
+    "university of iowa": "University of Iowa",
+    "indiana university": "Indiana University",
+    "pennsylvania state university": "Pennsylvania State University",
+    "penn state": "Pennsylvania State University",
+    
+    # Recent additions
+    "university of maryland": "University of Maryland",
+    "rutgers university": "Rutgers University",
+    "university of nebraska": "University of Nebraska",
+    "university of oregon": "University of Oregon",
+    "university of washington": "University of Washington",
+    "university of california": "University of California", # UCLA, USC
+    "usc": "University of Southern California",
+    "ucla": "University of California, Los Angeles"
+}
+
+# Alternative name patterns for fuzzy matching
+_BIG10_ALTERNATIVE_PATTERNS = {
+    # Common abbreviations and variations
+    "uiuc": "University of Illinois",
+    "u of i": "University of Illinois", 
+    "illinois": "University of Illinois",
+    "umich": "University of Michigan",
+    "u of m": "University of Michigan",
+    "michigan": "University of Michigan",
+    "msu": "Michigan State University",
+    "umn": "University of Minnesota",
+    "minnesota": "University of Minnesota",
+    "northwestern": "Northwestern University",
+    "osu": "Ohio State University",
+    "ohio state": "Ohio State University",
+    "purdue": "Purdue University",
+    "uw": "University of Wisconsin",
+    "wisconsin": "University of Wisconsin",
+    "iowa": "University of Iowa",
+    "iu": "Indiana University",
+    "indiana": "Indiana University",
+    "psu": "Pennsylvania State University",
+    "umd": "University of Maryland",
+    "maryland": "University of Maryland",
+    "rutgers": "Rutgers University",
+    "unl": "University of Nebraska",
+    "nebraska": "University of Nebraska",
+    "oregon": "University of Oregon",
+    "uw": "University of Washington",  # Note: conflicts with Wisconsin
+    "washington": "University of Washington"
+}
+
+# Campuses that mark a University of California posting
+_UC_CAMPUSES = ("los angeles", "ucla", "berkeley", "davis", "san diego", "irvine")
+
+# Organization-type suffixes dropped before matching university names
+_ORG_SUFFIX_RE = re.compile(r"\((?:state|federal|private)\)")
+
 
 @dataclass
 class ScraperConfig:
@@ -48,7 +349,15 @@ class ScraperConfig:
     min_delay: float = 2.0
     max_delay: float = 5.0
     timeout: int = 20
+    reload_timeout: float = 5.0  # How long an action may take to start reloading results
+    page_load_timeout: int = 30
     headless: bool = True
+    reuse_details: bool = True  # Reuse detail-page fields from the previous run's output
+    # Refetch details scraped longer ago than this. A week plus a day of slack,
+    # so the weekly scheduled run reuses the previous run's detail pages; an
+    # edited posting can therefore be served stale for up to this long (use
+    # --refresh-details to refetch everything)
+    detail_cache_max_age_hours: float = 8 * 24.0
     
     def __post_init__(self):
         """Create output directory if it doesn't exist."""
@@ -120,14 +429,17 @@ class WildlifeJobScraper:
         
     def _setup_logging(self) -> None:
         """Configure logging for the scraper."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(self.config.log_file)
-            ]
-        )
+        # basicConfig is a no-op once the root logger has handlers, but building
+        # the FileHandler would still open the log file; only do it the first time
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(levelname)s - %(message)s",
+                handlers=[
+                    logging.StreamHandler(),
+                    logging.FileHandler(self.config.log_file)
+                ]
+            )
         self.logger = logging.getLogger(__name__)
         
     def _human_pause(self, min_seconds: Optional[float] = None, 
@@ -160,7 +472,18 @@ class WildlifeJobScraper:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-        
+
+        # Return from driver.get() at DOMContentLoaded; callers wait on the
+        # elements they need rather than on every subresource
+        options.page_load_strategy = "eager"
+
+        # Skip image downloads and notification prompts; only DOM text is scraped
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+
         # Anti-detection measures
         options.add_argument(f"user-agent={self.ua.random}")
         options.add_argument("--disable-blink-features=AutomationControlled")
@@ -170,12 +493,21 @@ class WildlifeJobScraper:
         # Setup driver service
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(self.config.page_load_timeout)
         
         # Additional anti-detection
         driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
         
+        # Block web fonts and media as well. Stylesheets are left alone because
+        # element .text depends on CSS visibility.
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_RESOURCE_PATTERNS})
+        except Exception as e:
+            self.logger.warning(f"Could not block font/media requests: {e}")
+        
         self.logger.info("Chrome WebDriver initialized successfully")
         return driver
         
@@ -206,6 +538,51 @@ class WildlifeJobScraper:
             "arguments[0].scrollIntoView({block: 'center'});", element
         )
         
+    def _first_result(self) -> Optional[Any]:
+        """
+        Return the first search result currently rendered, if any.
+        
+        Returns:
+            Optional[WebElement]: First result link, used to detect list reloads
+        """
+        results = self.driver.find_elements(By.CSS_SELECTOR, "a.list-group-item")
+        return results[0] if results else None
+        
+    def _wait_for_results_refresh(self, old_result: Optional[Any],
+                                  timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a result list to be replaced instead of sleeping a fixed time.
+        
+        Never raises on a timeout; callers decide whether a missed reload matters.
+        
+        Args:
+            old_result: Element returned by _first_result() before the action
+            timeout: Seconds to wait for old_result to go stale (default: reload_timeout)
+            
+        Returns:
+            bool: True if the list was replaced and results are present
+        """
+        if timeout is None:
+            timeout = self.config.reload_timeout
+        
+        refreshed = True
+        if old_result is not None:
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.staleness_of(old_result)
+                )
+            except TimeoutException:
+                self.logger.debug("Result list did not reload; continuing")
+                refreshed = False
+        
+        # Either way, make sure a result list is present before extraction
+        try:
+            self._wait_for_element((By.CSS_SELECTOR, "a.list-group-item"))
+        except TimeoutException:
+            self.logger.warning("No search results rendered")
+            return False
+        return refreshed
+        
     def set_date_filter(self) -> None:
         """Set the date filter for job postings."""
         try:
@@ -229,9 +606,11 @@ class WildlifeJobScraper:
             # Click the desired filter option
             filter_xpath = f"//a[@class='dropdown-item' and contains(text(), '{filter_text}')]"
             filter_option = self._wait_for_element((By.XPATH, filter_xpath))
+            old_result = self._first_result()
             filter_option.click()
             
-            self._human_pause()
+            # Wait for the filtered results before they are extracted
+            self._wait_for_results_refresh(old_result)
             self.logger.info(f"Set date filter to: {filter_text}")
             
         except Exception as e:
@@ -243,15 +622,21 @@ class WildlifeJobScraper:
         try:
             # Scroll to bottom to find page size dropdown
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self._human_pause()
             
             dropdown = self._wait_for_element((By.XPATH, "//select[@name='PageSize']"))
             self._scroll_to_element(dropdown)
             
             select = Select(dropdown)
-            select.select_by_visible_text(f"Show {self.config.page_size}")
+            option_text = f"Show {self.config.page_size}"
+            if select.first_selected_option.text.strip() == option_text:
+                # Already selected: re-selecting would not reload the results
+                self.logger.info(f"Page size already {self.config.page_size}")
+                return
             
-            self._human_pause()
+            old_result = self._first_result()
+            select.select_by_visible_text(option_text)
+            
+            self._wait_for_results_refresh(old_result)
             self.logger.info(f"Set page size to {self.config.page_size}")
             
         except Exception as e:
@@ -273,10 +658,10 @@ class WildlifeJobScraper:
             
             search_box.clear()
             search_box.send_keys(search_terms)
-            self._human_pause()
             
+            old_result = self._first_result()
             search_box.send_keys(Keys.RETURN)
-            self._human_pause()
+            self._wait_for_results_refresh(old_result)
             
             self.logger.info(f"Entered search keywords: {search_terms}")
             
@@ -311,8 +696,7 @@ class WildlifeJobScraper:
                     onclick = element.get_attribute("onclick") or ""
                     if "view-job/?id=" in onclick:
                         # Extract job ID from onclick: window.open('/view-job/?id=106934', '_blank')
-                        import re
-                        match = re.search(r"view-job/\?id=(\d+)", onclick)
+                        match = _JOB_ID_RE.search(onclick)
                         if match:
                             job_id = match.group(1)
                             job_url = f"https://jobs.rwfm.tamu.edu/view-job/?id={job_id}"
@@ -344,7 +728,9 @@ class WildlifeJobScraper:
             # Extract tags
             try:
                 tag_elements = job_element.find_elements(By.CSS_SELECTOR, ".badge.bg-secondary")
-                tags = ", ".join(tag.text.strip() for tag in tag_elements if tag.text.strip())
+                # .text is a WebDriver round-trip, so read each tag's text once
+                tag_texts = (tag.text.strip() for tag in tag_elements)
+                tags = ", ".join(text for text in tag_texts if text)
                 tags = tags or "N/A"
             except:
                 tags = "N/A"
@@ -388,30 +774,11 @@ class WildlifeJobScraper:
             # Extract detailed description
             description = ""
             try:
-                # Try multiple common selectors for job descriptions
-                desc_selectors = [
-                    "div.job-description",
-                    "div.position-description", 
-                    "div[class*='description']",
-                    "div.content",
-                    "div.job-details",
-                    ".card-body",
-                    "main .container"
-                ]
-                
-                for selector in desc_selectors:
-                    try:
-                        desc_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        description = desc_element.text.strip()
-                        if description and len(description) > 100:  # Ensure we got substantial content
-                            break
-                    except:
-                        continue
-                        
-                if not description:
-                    # Fallback: get all text from main content area
-                    body_element = self.driver.find_element(By.TAG_NAME, "body")
-                    description = body_element.text.strip()
+                # Try the description selectors in order inside the browser, falling
+                # back to the whole body: one round-trip instead of two per selector
+                description = self.driver.execute_script(
+                    _DESCRIPTION_SCRIPT, list(_DESCRIPTION_SELECTORS)
+                ) or ""
                     
             except Exception as e:
                 self.logger.warning(f"Could not extract description for {job.title}: {e}")
@@ -419,43 +786,26 @@ class WildlifeJobScraper:
             # Extract requirements section
             requirements = ""
             try:
-                req_keywords = [
-                    "requirements", "qualifications", "prerequisites", 
-                    "education", "experience", "skills", "must have"
-                ]
-                
-                for keyword in req_keywords:
-                    try:
-                        req_element = self.driver.find_element(
-                            By.XPATH, 
-                            f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{keyword}')]"
-                        )
-                        # Get the parent container or following content
-                        parent = req_element.find_element(By.XPATH, "./..")
-                        requirements = parent.text.strip()
-                        if requirements and len(requirements) > 50:
-                            break
-                    except:
-                        continue
+                # Evaluate the keyword XPaths and read the matching parent's text
+                # in the browser: one round-trip instead of three per keyword
+                requirements = self.driver.execute_script(
+                    _REQUIREMENTS_SCRIPT, list(_REQUIREMENT_XPATHS)
+                ) or ""
                         
             except Exception as e:
                 self.logger.warning(f"Could not extract requirements for {job.title}: {e}")
             
             # Extract project details (research-specific content)
             project_details = ""
+            desc_lower = description.lower()
             try:
-                project_keywords = [
-                    "research", "project", "thesis", "dissertation", 
-                    "study", "investigation", "analysis", "field work"
-                ]
-                
-                desc_lower = description.lower()
-                for keyword in project_keywords:
+                sentences = None  # (stripped, lowercased) pairs, split on first use
+                for keyword in _PROJECT_KEYWORDS:
                     if keyword in desc_lower:
                         # Extract sentences containing research keywords
-                        import re
-                        sentences = re.split(r'[.!?]+', description)
-                        project_sentences = [s.strip() for s in sentences if keyword in s.lower()]
+                        if sentences is None:
+                            sentences = [(s.strip(), s.lower()) for s in _SENTENCE_SPLIT_RE.split(description)]
+                        project_sentences = [text for text, lower in sentences if keyword in lower]
                         if project_sentences:
                             project_details = ". ".join(project_sentences[:3])  # First 3 relevant sentences
                             break
@@ -466,18 +816,18 @@ class WildlifeJobScraper:
             # Extract contact information
             contact_info = ""
             try:
-                contact_selectors = [
-                    "*[contains(text(), '@')]",  # Email addresses
-                    "*[contains(text(), 'contact')]",
-                    "*[contains(text(), 'Contact')]",
-                    ".contact-info"
-                ]
-                
-                for selector in contact_selectors:
+                # Only accept an e-mail address, so a "Contact Us" nav link
+                # or similar boilerplate is never stored as contact info
+                for locator in _CONTACT_LOCATORS:
                     try:
-                        contact_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        contact_info = contact_element.text.strip()
-                        if contact_info and "@" in contact_info:
+                        contact_element = self.driver.find_element(*locator)
+                        text = contact_element.text.strip()
+                        if "@" in text:
+                            contact_info = text
+                            break
+                        href = contact_element.get_attribute("href") or ""
+                        if href.lower().startswith("mailto:"):
+                            contact_info = href[len("mailto:"):].split("?")[0]
                             break
                     except:
                         continue
@@ -488,15 +838,10 @@ class WildlifeJobScraper:
             # Extract application deadline
             deadline = job.application_deadline  # Keep existing value as default
             try:
-                deadline_keywords = ["deadline", "due", "apply by", "closing date"]
-                desc_lower = description.lower()
-                
-                for keyword in deadline_keywords:
+                for keyword, pattern in _DEADLINE_PATTERNS:
                     if keyword in desc_lower:
                         # Try to extract date after keyword
-                        import re
-                        pattern = rf"{keyword}[:\s]*([^.]*(?:\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{2,4}}|[A-Za-z]+\s+\d{{1,2}},?\s*\d{{4}})[^.]*)"
-                        match = re.search(pattern, description, re.IGNORECASE)
+                        match = pattern.search(description)
                         if match:
                             deadline = match.group(1).strip()
                             break
@@ -517,74 +862,31 @@ class WildlifeJobScraper:
             self.logger.error(f"Failed to extract detailed info for {job.title}: {e}")
             return job
     
-    def classify_graduate_position(self, job: JobListing) -> JobListing:
+    def classify_graduate_position(self, job: JobListing,
+                                   full_text: Optional[str] = None) -> JobListing:
         """
         Classify if a position is a true graduate assistantship.
         
         Args:
             job: JobListing with detailed information
+            full_text: Precomputed _classification_text(job), if available
             
         Returns:
             JobListing: Enhanced with classification data
         """
         try:
-            # Combine all text for analysis
-            full_text = f"{job.title} {job.description} {job.requirements} {job.project_details} {job.tags}".lower()
-            
-            # Graduate position indicators (positive signals) - ENHANCED
-            graduate_indicators = [
-                "graduate assistantship", "graduate assistant", "graduate student",
-                "master's student", "ms student", "phd student", "doctoral student",
-                "masters", "master's", "phd", "ph.d.", "doctorate", "doctoral",
-                "assistantship", "fellowship", "graduate", "grad student",
-                "thesis", "dissertation", "research assistant", "teaching assistant", 
-                "graduate research", "graduate teaching", "stipend", "tuition waiver",
-                "advisor", "adviser", "mentorship", "research project",
-                "academic year", "semester", "graduate program", "grad program"
-            ]
-            
-            # Non-graduate indicators (negative signals) - WILDLIFE-SPECIFIC ENHANCED
-            non_graduate_indicators = [
-                # General professional roles
-                "professional position", "full-time employee", "staff position",
-                "technician", "tech", "coordinator", "manager", "director", 
-                "volunteer", "intern", "internship", "apprentice",
-                
-                # Wildlife/Natural Resource specific roles
-                "biologist", "hydrologist", "scientist", "botanist", "ecologist",
-                "conservationist", "park ranger", "crew leader", "crew member",
-                "habitat specialist", "regional coordinator", "liaison",
-                "educator", "specialist", "officer", "program officer", "programme officer",
-                "project manager", "production manager", "seasonal", 
-                "human resource officer", "hr officer",
-                
-                # Academic non-assistantship roles  
-                "continuing education", "certification", "workshop", "training program",
-                "degree program", "bachelor", "undergraduate", "post-doc", "postdoc",
-                "visiting scholar", "faculty", "professor", "lecturer"
-            ]
-            
-            # Research project indicators
-            research_indicators = [
-                "research", "study", "investigation", "analysis", "field work",
-                "data collection", "sampling", "monitoring", "experiment",
-                "publication", "conference", "methodology", "hypothesis"
-            ]
+            # Combine all text for analysis unless the caller already did
+            if full_text is None:
+                full_text = _classification_text(job)
             
             # Calculate scores with enhanced weighting
-            grad_score = sum(1 for indicator in graduate_indicators if indicator in full_text)
-            non_grad_score = sum(1 for indicator in non_graduate_indicators if indicator in full_text)
-            research_score = sum(1 for indicator in research_indicators if indicator in full_text)
+            grad_score = sum(1 for indicator in _GRADUATE_INDICATORS if indicator in full_text)
+            non_grad_score = sum(1 for indicator in _NON_GRADUATE_INDICATORS if indicator in full_text)
+            research_score = sum(1 for indicator in _RESEARCH_INDICATORS if indicator in full_text)
             
             # Check for key strong indicators
-            key_graduate_terms = ["masters", "master's", "phd", "ph.d.", "assistantship", "fellowship"]
-            has_key_graduate = any(term in full_text for term in key_graduate_terms)
-            
-            key_professional_terms = [
-                "biologist", "hydrologist", "scientist", "botanist", "technician", 
-                "park ranger", "specialist", "coordinator", "manager", "officer"
-            ]
-            has_key_professional = any(term in full_text for term in key_professional_terms)
+            has_key_graduate = any(term in full_text for term in _KEY_GRADUATE_TERMS)
+            has_key_professional = any(term in full_text for term in _KEY_PROFESSIONAL_TERMS)
             
             # Enhanced classification logic
             confidence = 0.0
@@ -663,117 +965,31 @@ class WildlifeJobScraper:
             job.position_type = "Unknown"
             return job
     
-    def classify_discipline(self, job: JobListing) -> JobListing:
+    def classify_discipline(self, job: JobListing,
+                            full_text: Optional[str] = None) -> JobListing:
         """
         Classify the academic discipline of a position using detailed content analysis.
         
         Args:
             job: JobListing with detailed information
+            full_text: Precomputed _classification_text(job), if available
             
         Returns:
             JobListing: Enhanced with discipline classification
         """
         try:
-            # Combine all text for analysis
-            full_text = f"{job.title} {job.description} {job.requirements} {job.project_details} {job.tags}".lower()
-            
-            # Wildlife & Natural Resources discipline indicators
-            wildlife_keywords = [
-                # Wildlife management and ecology
-                "wildlife", "wild animals", "animal ecology", "wildlife management",
-                "wildlife conservation", "game species", "hunting", "wildlife habitat",
-                "deer", "elk", "bear", "waterfowl", "bird", "avian", "ornithology",
-                "mammal", "ungulate", "predator", "carnivore", "herbivore",
-                "migration", "behavior", "animal behavior", "population dynamics",
-                "wildlife disease", "wildlife health", "capture", "telemetry",
-                
-                # Habitat and ecosystem
-                "habitat", "ecosystem", "biodiversity", "conservation biology",
-                "landscape ecology", "habitat restoration", "wetland", "grassland",
-                "forest ecology", "rangeland", "prairie", "savanna"
-            ]
-            
-            # Fisheries & Aquatic Science indicators  
-            fisheries_keywords = [
-                # Fish and aquatic life
-                "fish", "fisheries", "aquatic", "marine", "freshwater", "stream",
-                "river", "lake", "pond", "reservoir", "estuary", "coastal",
-                "salmon", "trout", "bass", "catfish", "walleye", "pike",
-                "aquaculture", "fish farming", "hatchery", "fish stocking",
-                
-                # Aquatic ecology
-                "aquatic ecology", "stream ecology", "limnology", "hydrology",
-                "water quality", "aquatic habitat", "fish habitat", "spawning",
-                "fish population", "fish community", "ichthyology",
-                "aquatic invertebrates", "plankton", "algae", "aquatic plants"
-            ]
-            
-            # Natural Resource Management indicators
-            natural_resources_keywords = [
-                # General natural resources
-                "natural resources", "resource management", "environmental management",
-                "land management", "public lands", "national forest", "state park",
-                "BLM", "bureau of land management", "forest service", "park service",
-                
-                # Forestry and land use
-                "forestry", "forest management", "timber", "silviculture",
-                "fire ecology", "prescribed fire", "wildfire", "fire management",
-                "recreation", "outdoor recreation", "hunting", "fishing",
-                "grazing", "livestock", "ranching", "agriculture",
-                
-                # Policy and human dimensions
-                "environmental policy", "natural resource policy", "environmental law",
-                "human dimensions", "stakeholder", "community engagement",
-                "environmental education", "interpretation", "outreach"
-            ]
-            
-            # Environmental Science (broader) indicators
-            environmental_keywords = [
-                # Environmental science
-                "environmental science", "environmental studies", "ecology",
-                "ecosystem services", "sustainability", "climate change",
-                "environmental chemistry", "environmental toxicology",
-                "environmental monitoring", "environmental assessment",
-                
-                # Conservation and restoration
-                "conservation", "restoration", "endangered species", "threatened species",
-                "species recovery", "habitat restoration", "ecosystem restoration",
-                "invasive species", "native species", "biodiversity conservation",
-                
-                # Pollution and contamination
-                "pollution", "contamination", "environmental remediation",
-                "water pollution", "air quality", "soil contamination",
-                "environmental health", "environmental impact"
-            ]
+            # Combine all text for analysis unless the caller already did
+            if full_text is None:
+                full_text = _classification_text(job)
             
             # Calculate discipline scores
-            disciplines = {
-                "Wildlife & Natural Resources": wildlife_keywords,
-                "Fisheries & Aquatic Science": fisheries_keywords,
-                "Natural Resource Management": natural_resources_keywords,
-                "Environmental Science": environmental_keywords
-            }
-            
-            discipline_scores = {}
-            discipline_matches = {}
+            discipline_scores = dict.fromkeys(DISCIPLINE_KEYWORDS, 0)
+            discipline_matches = {discipline: [] for discipline in DISCIPLINE_KEYWORDS}
             
-            for discipline, keywords in disciplines.items():
-                matches = []
-                score = 0
-                
-                for keyword in keywords:
-                    if keyword in full_text:
-                        matches.append(keyword)
-                        # Weight longer, more specific keywords higher
-                        if len(keyword.split()) > 2:
-                            score += 3  # Multi-word specific terms
-                        elif len(keyword.split()) == 2:
-                            score += 2  # Two-word terms
-                        else:
-                            score += 1  # Single words
-                            
-                discipline_scores[discipline] = score
-                discipline_matches[discipline] = matches
+            for keyword, discipline, weight in _DISCIPLINE_TERMS:
+                if keyword in full_text:
+                    discipline_matches[discipline].append(keyword)
+                    discipline_scores[discipline] += weight
             
             # Find best discipline match
             if max(discipline_scores.values()) == 0:
@@ -783,7 +999,7 @@ class WildlifeJobScraper:
             else:
                 best_discipline = max(discipline_scores, key=discipline_scores.get)
                 best_score = discipline_scores[best_discipline]
-                total_possible = len(disciplines[best_discipline]) * 3  # Max if all were 3-word terms
+                total_possible = len(DISCIPLINE_KEYWORDS[best_discipline]) * 3  # Max if all were 3-word terms
                 confidence = min(0.95, best_score / max(10, total_possible * 0.3))  # Scale appropriately
                 matched_keywords = discipline_matches[best_discipline]
             
@@ -839,72 +1055,12 @@ class WildlifeJobScraper:
             JobListing: Enhanced with university classification
         """
         try:
-            # Big 10 universities (current conference members as of 2024)
-            big10_universities = {
-                # Original Big 10
-                "university of illinois": "University of Illinois",
-                "university of chicago": "University of Chicago", 
-                "university of michigan": "University of Michigan",
-                "michigan state university": "Michigan State University",
-                "university of minnesota": "University of Minnesota",
-                "northwestern university": "Northwestern University", 
-                "ohio state university": "Ohio State University",
-                "purdue university": "Purdue University",
-                "university of wisconsin": "University of Wisconsin",
-                "university of iowa": "University of Iowa",
-                "indiana university": "Indiana University",
-                "pennsylvania state university": "Pennsylvania State University",
-                "penn state": "Pennsylvania State University",
-                
-                # Recent additions
-                "university of maryland": "University of Maryland",
-                "rutgers university": "Rutgers University",
-                "university of nebraska": "University of Nebraska",
-                "university of oregon": "University of Oregon",
-                "university of washington": "University of Washington",
-                "university of california": "University of California", # UCLA, USC
-                "usc": "University of Southern California",
-                "ucla": "University of California, Los Angeles"
-            }
-            
-            # Alternative name patterns for fuzzy matching
-            alternative_patterns = {
-                # Common abbreviations and variations
-                "uiuc": "University of Illinois",
-                "u of i": "University of Illinois", 
-                "illinois": "University of Illinois",
-                "umich": "University of Michigan",
-                "u of m": "University of Michigan",
-                "michigan": "University of Michigan",
-                "msu": "Michigan State University",
-                "umn": "University of Minnesota",
-                "minnesota": "University of Minnesota",
-                "northwestern": "Northwestern University",
-                "osu": "Ohio State University",
-                "ohio state": "Ohio State University",
-                "purdue": "Purdue University",
-                "uw": "University of Wisconsin",
-                "wisconsin": "University of Wisconsin",
-                "iowa": "University of Iowa",
-                "iu": "Indiana University",
-                "indiana": "Indiana University",
-                "psu": "Pennsylvania State University",
-                "umd": "University of Maryland",
-                "maryland": "University of Maryland",
-                "rutgers": "Rutgers University",
-                "unl": "University of Nebraska",
-                "nebraska": "University of Nebraska",
-                "oregon": "University of Oregon",
-                "uw": "University of Washington",  # Note: conflicts with Wisconsin
-                "washington": "University of Washington"
-            }
-            
             # Combine organization name and description for analysis
             full_text = f"{job.organization} {job.description}".lower()
             
             # Clean up common organizational suffixes
             org_text = job.organization.lower()
-            org_text = org_text.replace("(state)", "").replace("(federal)", "").replace("(private)", "")
+            org_text = _ORG_SUFFIX_RE.sub("", org_text)
             org_text = org_text.replace("university system", "university")
             org_text = org_text.strip()
             
@@ -912,7 +1068,7 @@ class WildlifeJobScraper:
             university_name = ""
             
             # Check direct matches first
-            for pattern, standard_name in big10_universities.items():
+            for pattern, standard_name in _BIG10_UNIVERSITIES.items():
                 if pattern in org_text:
                     is_big10 = True
                     university_name = standard_name
@@ -920,7 +1076,7 @@ class WildlifeJobScraper:
                     
             # Check alternative patterns if no direct match
             if not is_big10:
-                for pattern, standard_name in alternative_patterns.items():
+                for pattern, standard_name in _BIG10_ALTERNATIVE_PATTERNS.items():
                     if pattern in org_text:
                         is_big10 = True
                         university_name = standard_name
@@ -937,7 +1093,7 @@ class WildlifeJobScraper:
                     
             # Handle University of California system
             if "university of california" in org_text or "uc " in org_text:
-                if any(campus in full_text for campus in ["los angeles", "ucla", "berkeley", "davis", "san diego", "irvine"]):
+                if any(campus in full_text for campus in _UC_CAMPUSES):
                     is_big10 = True
                     university_name = "University of California"
             
@@ -982,16 +1138,17 @@ class WildlifeJobScraper:
             List[int]: List of page numbers to scrape
         """
         try:
-            # Use the working selector that finds onclick attributes with pageNumCtrl
-            pagination_links = self.driver.find_elements(
-                By.XPATH, "//a[contains(@onclick, 'pageNumCtrl.value=')]"
-            )
+            # Collect every pageNumCtrl onclick handler in one round-trip rather
+            # than one get_attribute call per pagination link
+            onclick_attrs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(\"a[onclick*='pageNumCtrl.value=']\"),"
+                " function (a) { return a.getAttribute('onclick'); });"
+            ) or []
             
             page_numbers = []
             max_page = 1
             
-            for link in pagination_links:
-                onclick_attr = link.get_attribute("onclick")
+            for onclick_attr in onclick_attrs:
                 if onclick_attr and "pageNumCtrl.value=" in onclick_attr:
                     try:
                         # Extract page number from onclick="pageNumCtrl.value=2; submitListingForm(true);"
@@ -1011,9 +1168,7 @@ class WildlifeJobScraper:
                 # Fallback: try to detect total pages from results text
                 try:
                     results_text = self.driver.find_element(By.XPATH, "//*[contains(text(), 'of')]").text
-                    # Look for pattern like "(1 - 10 of 233)"
-                    import re
-                    match = re.search(r'of\s+(\d+)', results_text)
+                    match = _RESULTS_TOTAL_RE.search(results_text)
                     if match:
                         total_results = int(match.group(1))
                         pages_needed = (total_results + self.config.page_size - 1) // self.config.page_size
@@ -1029,28 +1184,75 @@ class WildlifeJobScraper:
             self.logger.warning(f"Failed to get pagination info: {e}")
             return [1]  # Return page 1 as fallback
             
-    def navigate_to_page(self, page_number: int) -> None:
+    def navigate_to_page(self, page_number: int) -> bool:
         """
         Navigate to a specific page number.
         
         Args:
             page_number: Page number to navigate to
+            
+        Returns:
+            bool: True if the page loaded, False if it should be skipped
         """
         try:
+            # Remember the current first result so we can tell when it is replaced
+            old_result = self._first_result()
+            
             self.driver.execute_script(
                 f"pageNumCtrl.value={page_number}; submitListingForm(true);"
             )
             
-            # Wait for new results to load
-            self._wait_for_element((By.CSS_SELECTOR, "a.list-group-item"))
+            # Wait for the old results to be swapped out, then for the new ones.
+            # Presence alone is satisfied immediately by the previous page.
+            if not self._wait_for_results_refresh(old_result, self.config.timeout):
+                self.logger.warning(f"Page {page_number} did not load; skipping it")
+                return False
             self._human_pause()
             
             self.logger.info(f"Navigated to page {page_number}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to navigate to page {page_number}: {e}")
-            raise
+            return False
             
+    def _load_cached_details(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load detail-page fields from the previous run, keyed by job URL.
+        
+        Returns:
+            Dict[str, Dict[str, str]]: Detail fields for each previously scraped URL
+        """
+        cache_file = self.config.output_dir / "all_positions_detailed.json"
+        if not self.config.reuse_details or not cache_file.exists():
+            return {}
+        
+        try:
+            raw = cache_file.read_bytes()
+            previous = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read cached job details from {cache_file}: {e}")
+            return {}
+        
+        if not isinstance(previous, list):
+            return {}
+        
+        # Only entries whose detail page yielded a description and that were
+        # scraped recently enough are reusable; edited postings get refetched
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.config.detail_cache_max_age_hours)
+        cached = {}
+        for job in previous:
+            if not (isinstance(job, dict) and job.get("url") and job.get("description")):
+                continue
+            scraped_at = _parse_timestamp(job.get("scraped_at"))
+            if scraped_at is None or scraped_at < cutoff:
+                continue
+            details = {field: job.get(field, "") for field in _DETAIL_FIELDS}
+            # Carry the original fetch time forward so the age keeps counting
+            details["scraped_at"] = job["scraped_at"]
+            cached[job["url"]] = details
+        return cached
+        
     def scrape_all_jobs(self) -> List[JobListing]:
         """
         Scrape job listings from all available pages with detailed content extraction.
@@ -1080,49 +1282,84 @@ class WildlifeJobScraper:
                 if page_num == 1:  # Skip first page (already scraped)
                     continue
                     
-                self.navigate_to_page(page_num)
+                # A page that fails to load is skipped rather than aborting the run
+                if not self.navigate_to_page(page_num):
+                    continue
                 page_jobs = self.extract_jobs_from_page()
                 all_jobs.extend(page_jobs)
             
             self.logger.info(f"Initial extraction complete: {len(all_jobs)} jobs found")
             
-            # Phase 2: Extract detailed information and classify positions
+            # Listings can reappear across pages while results shift; visit each
+            # detail page once. Jobs without a URL are kept as-is.
+            seen_urls = set()
+            unique_jobs = []
+            for job in all_jobs:
+                if job.url:
+                    if job.url in seen_urls:
+                        continue
+                    seen_urls.add(job.url)
+                unique_jobs.append(job)
+            if len(unique_jobs) < len(all_jobs):
+                self.logger.info(f"Skipping {len(all_jobs) - len(unique_jobs)} duplicate listings")
+                all_jobs = unique_jobs
+            
+            # Phase 2: Extract detailed information and classify positions.
+            # Detail pages seen on a previous run are not fetched again.
+            detail_cache = self._load_cached_details()
+            reused_details = 0
             enhanced_jobs = []
+            graduate_jobs = 0
+            high_confidence = 0
             for i, job in enumerate(all_jobs):
                 self.logger.info(f"Processing job {i+1}/{len(all_jobs)}: {job.title}")
                 
                 try:
                     # Extract detailed information
-                    enhanced_job = self.extract_detailed_job_info(job)
+                    cached = detail_cache.get(job.url) if job.url else None
+                    if cached:
+                        for field, value in cached.items():
+                            setattr(job, field, value)
+                        enhanced_job = job
+                        reused_details += 1
+                    else:
+                        enhanced_job = self.extract_detailed_job_info(job)
+                    
+                    # Both classifiers scan the same lowercased text; build it once
+                    full_text = _classification_text(enhanced_job)
                     
                     # Classify position type
-                    classified_job = self.classify_graduate_position(enhanced_job)
+                    classified_job = self.classify_graduate_position(enhanced_job, full_text)
                     
                     # Classify discipline
-                    disciplined_job = self.classify_discipline(classified_job)
+                    disciplined_job = self.classify_discipline(classified_job, full_text)
                     
                     # Classify university
                     final_job = self.classify_university(disciplined_job)
                     
                     enhanced_jobs.append(final_job)
-                    
-                    # Progress logging
-                    if (i + 1) % 5 == 0:
-                        grad_count = sum(1 for j in enhanced_jobs if j.is_graduate_position)
-                        self.logger.info(f"Progress: {i+1}/{len(all_jobs)} processed, {grad_count} graduate positions found")
                         
                 except Exception as e:
                     self.logger.error(f"Failed to process job {job.title}: {e}")
                     # Add job with basic info even if detailed extraction fails
                     enhanced_jobs.append(job)
+                
+                # Running totals for progress logging and the final summary
+                if enhanced_jobs[-1].is_graduate_position:
+                    graduate_jobs += 1
+                if enhanced_jobs[-1].grad_confidence >= 0.8:
+                    high_confidence += 1
+                
+                # Progress logging
+                if (i + 1) % 5 == 0:
+                    self.logger.info(f"Progress: {i+1}/{len(all_jobs)} processed, {graduate_jobs} graduate positions found")
                     
             # Final summary
             total_jobs = len(enhanced_jobs)
-            graduate_jobs = sum(1 for job in enhanced_jobs if job.is_graduate_position)
-            high_confidence = sum(1 for job in enhanced_jobs if job.grad_confidence >= 0.8)
             
             self.logger.info(f"Scraping complete:")
             self.logger.info(f"  Total positions: {total_jobs}")
+            self.logger.info(f"  Detail pages reused from previous run: {reused_details}")
             self.logger.info(f"  Graduate assistantships: {graduate_jobs}")
             self.logger.info(f"  High confidence classifications: {high_confidence}")
             
@@ -1151,8 +1388,7 @@ class WildlifeJobScraper:
         # Convert to dictionaries for JSON serialization
         jobs_data = [job.dict() for job in jobs]
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+        _write_json(output_path, jobs_data)
             
         self.logger.info(f"Saved {len(jobs)} jobs to {output_path}")
         return output_path
@@ -1208,11 +1444,9 @@ class WildlifeJobScraper:
         # Convert to dictionaries for JSON serialization
         jobs_data = [job.dict() for job in graduate_jobs]
         
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
-        # Save CSV to processed directory
+        _write_json(json_path, jobs_data)
+        # Save CSV to processed directory, reusing the dicts built for JSON
         csv_path = processed_dir / "verified_graduate_assistantships.csv"
-        jobs_data = [job.dict() for job in graduate_jobs]
         df = pd.DataFrame(jobs_data)
         df.to_csv(csv_path, index=False, encoding="utf-8")
         
@@ -1233,21 +1467,47 @@ class WildlifeJobScraper:
             report["classification_breakdown"][pos_type] += 1
         
         report_path = processed_dir / "classification_report.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_json(report_path, report)
             
         self.logger.info(f"Saved classification report to {report_path}")
         
         return json_path, csv_path
 
 
-def main() -> None:
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp, treating naive values as UTC; None if invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point for the enhanced scraper."""
+    parser = argparse.ArgumentParser(description="Scrape wildlife graduate assistantships.")
+    parser.add_argument(
+        "--refresh-details", action="store_true",
+        help="Fetch every detail page again instead of reusing recent results"
+    )
+    args = parser.parse_args(argv)
+    
     try:
         # Generate unique run ID for this scraping session
         run_id = f"scrape_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
         
-        config = ScraperConfig()
+        config = ScraperConfig(reuse_details=not args.refresh_details)
         scraper = WildlifeJobScraper(config)
         scraper.scrape_run_id = run_id
         
@@ -1265,8 +1525,15 @@ def main() -> None:
             
             # Print summary
             total_jobs = len(jobs)
-            graduate_jobs = sum(1 for job in jobs if job.is_graduate_position)
-            high_confidence = sum(1 for job in jobs if job.grad_confidence >= 0.8)
+            graduate_jobs = 0
+            high_confidence = 0
+            position_types = {}
+            for job in jobs:
+                if job.is_graduate_position:
+                    graduate_jobs += 1
+                if job.grad_confidence >= 0.8:
+                    high_confidence += 1
+                position_types[job.position_type] = position_types.get(job.position_type, 0) + 1
             
             print(f"\n=== SCRAPING COMPLETE ===")
             print(f"Total positions found: {total_jobs}")
@@ -1276,11 +1543,6 @@ def main() -> None:
             print(f"Classification report saved to: classification_report.json")
             
             # Show position type breakdown
-            position_types = {}
-            for job in jobs:
-                pos_type = job.position_type
-                position_types[pos_type] = position_types.get(pos_type, 0) + 1
-            
             print(f"\nPosition Type Breakdown:")
             for pos_type, count in sorted(position_types.items(), key=lambda x: x[1], reverse=True):
                 print(f"  {pos_type}: {count}")